@@ -1,12 +1,16 @@
 import json
+from threading import Event
 from typing import Dict
+from unittest.mock import patch
 
 import pytest
+import requests
 from pytest_httpserver import HTTPServer
 from werkzeug import Request, Response
 
 import weaviate
 from mock_tests.conftest import MOCK_SERVER_URL
+from weaviate.exceptions import UnexpectedStatusCodeException
 
 
 @pytest.mark.parametrize(
@@ -45,3 +49,56 @@ def test_warning_old_weaviate(recwarn, httpserver: HTTPServer, version: str, war
         assert str(w.message).startswith("Dep001")
     else:
         assert len(recwarn) == 0
+
+
+def _count_requests(httpserver: HTTPServer, path: str) -> int:
+    return sum(request.path == path for request, _ in httpserver.log)
+
+
+def test_read_timeout_is_not_retried(weaviate_mock):
+    """Test that a request that timed out reading the response is not sent again."""
+    release = Event()
+
+    def handler(request: Request):
+        release.wait(5)
+        return Response(json.dumps({}))
+
+    weaviate_mock.expect_request("/v1/schema").respond_with_handler(handler)
+    weaviate_mock.expect_request("/v1/.well-known/ready").respond_with_data("")
+
+    client = weaviate.Client(url=MOCK_SERVER_URL, timeout_config=(2, 0.2))
+    with pytest.raises(requests.ReadTimeout):
+        client.schema.get()
+    release.set()
+    # the server handles one request at a time, so any retry is logged before this one
+    assert client.is_ready()
+    assert _count_requests(weaviate_mock, "/v1/schema") == 1
+
+
+@pytest.mark.parametrize("path", ["/v1/.well-known/ready", "/v1/.well-known/live"])
+def test_health_check_unavailable_is_not_retried(weaviate_mock, path: str):
+    """Test that the health endpoints report a 503 at once, while other requests retry it."""
+    weaviate_mock.expect_request(path).respond_with_data("", status=503)
+    weaviate_mock.expect_request("/v1/schema").respond_with_data("", status=503)
+
+    client = weaviate.Client(url=MOCK_SERVER_URL)
+    assert not (client.is_ready() if path.endswith("ready") else client.is_live())
+    assert _count_requests(weaviate_mock, path) == 1
+
+    with pytest.raises(UnexpectedStatusCodeException):
+        client.schema.get()
+    assert _count_requests(weaviate_mock, "/v1/schema") == 4
+
+
+def test_retry_after_header_is_ignored(weaviate_mock):
+    """Test that a server can not make a retried request wait longer than the backoff."""
+    weaviate_mock.expect_request("/v1/schema").respond_with_data(
+        "", status=429, headers={"Retry-After": "3600"}
+    )
+
+    client = weaviate.Client(url=MOCK_SERVER_URL)
+    with patch("urllib3.util.retry.time.sleep") as mock_sleep:
+        with pytest.raises(UnexpectedStatusCodeException):
+            client.schema.get()
+    assert _count_requests(weaviate_mock, "/v1/schema") == 4
+    assert [call[0][0] for call in mock_sleep.call_args_list] == [0.1, 0.2]
@@ -23,6 +23,7 @@ class TestBatch(unittest.TestCase):
         connection_error_retries: int = 3,
         batching_type: str = None,
         num_workers: int = 1,
+        compression: bool = False,
     ) -> None:
         """
         Check all configurable attributes of the Batch instance.
@@ -36,6 +37,7 @@ class TestBatch(unittest.TestCase):
         self.assertEqual(batch._connection_error_retries, connection_error_retries)
         self.assertEqual(batch._batching_type, batching_type)
         self.assertEqual(batch._num_workers, num_workers)
+        self.assertEqual(batch._compression, compression)
 
     # TEST SETTERS/GETTERS
 
@@ -314,6 +316,28 @@ class TestBatch(unittest.TestCase):
         self.check_instance(batch, batching_type="fixed")
         mock_auto_create.assert_not_called()
 
+    def test_compression(self):
+        """
+        Test Setter and Getter for 'compression'.
+        """
+
+        batch = Batch(mock_connection_func())
+        self.check_instance(batch)
+        self.assertFalse(batch.compression)
+
+        batch.compression = True
+        self.assertTrue(batch.compression)
+        self.check_instance(batch, compression=True)
+
+        batch.compression = False
+        self.assertFalse(batch.compression)
+        self.check_instance(batch)
+
+        with self.assertRaises(TypeError) as error:
+            batch.compression = 1
+        check_error_message(self, error, "'compression' must be of type bool.")
+        self.check_instance(batch)
+
     @patch("weaviate.batch.crud_batch.Batch._auto_create")
     def test_creation_time(self, mock_auto_create):
         """
@@ -845,7 +869,8 @@ class TestBatch(unittest.TestCase):
         batch.add_data_object({}, "Test")
         self.assertEqual(batch.create_objects(), "Test")
         mock_create_data.assert_called()
-        self.check_instance(batch, recom_num_obj=0)
+        # 2 objects in 1 second with a creation_time of 2 seconds
+        self.check_instance(batch, recom_num_obj=4)
         self.assertEqual(batch.num_objects(), 0)
 
     @patch("weaviate.batch.crud_batch.Batch._create_data")
@@ -883,7 +908,8 @@ class TestBatch(unittest.TestCase):
         )
         self.assertEqual(batch.create_references(), "Test")
         mock_create_data.assert_called()
-        self.check_instance(batch, recom_num_ref=0)
+        # 2 references in 1 second with a creation_time of 2 seconds
+        self.check_instance(batch, recom_num_ref=4)
         self.assertEqual(batch.num_references(), 0)
 
     def test_create_data(self):
@@ -899,6 +925,7 @@ class TestBatch(unittest.TestCase):
         mock_connection.post.assert_called_with(
             path="/batch/references",
             weaviate_object=[],
+            compress=False,
         )
         self.assertEqual(mock_connection.post.call_count, 1)
 
@@ -911,6 +938,7 @@ class TestBatch(unittest.TestCase):
         mock_connection.post.assert_called_with(
             path="/batch/references",
             weaviate_object=[],
+            compress=False,
         )
         self.assertEqual(mock_connection.post.call_count, 1)
 
@@ -938,6 +966,7 @@ class TestBatch(unittest.TestCase):
         mock_connection.post.assert_called_with(
             path="/batch/objects",
             weaviate_object={"fields": ["ALL"], "objects": []},
+            compress=False,
         )
 
         ## test ReadTimeout, timeout_retries = 0
@@ -951,6 +980,7 @@ class TestBatch(unittest.TestCase):
         mock_connection.post.assert_called_with(
             path="/batch/references",
             weaviate_object=[],
+            compress=False,
         )
         self.assertEqual(mock_connection.post.call_count, 1)
 
@@ -964,6 +994,7 @@ class TestBatch(unittest.TestCase):
         mock_connection.post.assert_called_with(
             path="/batch/objects",
             weaviate_object={"fields": ["ALL"], "objects": []},
+            compress=False,
         )
         self.assertEqual(mock_connection.post.call_count, 3 + 1)
 
@@ -978,6 +1009,7 @@ class TestBatch(unittest.TestCase):
         mock_connection.post.assert_called_with(
             path="/batch/references",
             weaviate_object=[],
+            compress=False,
         )
         self.assertEqual(mock_connection.post.call_count, 1)
 
@@ -991,6 +1023,7 @@ class TestBatch(unittest.TestCase):
         mock_connection.post.assert_called_with(
             path="/batch/objects",
             weaviate_object={"fields": ["ALL"], "objects": []},
+            compress=False,
         )
         self.assertEqual(mock_connection.post.call_count, 3 + 1)
 
@@ -1007,7 +1040,7 @@ class TestBatch(unittest.TestCase):
             raise err
 
         mock_connection = mock_connection_func(
-            "post", side_effect=lambda path, weaviate_object: alternating_errors()
+            "post", side_effect=lambda path, weaviate_object, compress: alternating_errors()
         )
         mock_connection.timeout_config = (2, 100)
         batch = Batch(mock_connection)
@@ -1019,6 +1052,7 @@ class TestBatch(unittest.TestCase):
         mock_connection.post.assert_called_with(
             path="/batch/objects",
             weaviate_object={"fields": ["ALL"], "objects": []},
+            compress=False,
         )
         self.assertEqual(mock_connection.post.call_count, 2 + 2 + 1)
 
@@ -1031,6 +1065,7 @@ class TestBatch(unittest.TestCase):
         mock_connection.post.assert_called_with(
             path="/batch/references",
             weaviate_object=[],
+            compress=False,
         )
 
     @patch("weaviate.batch.crud_batch.Batch._auto_create")
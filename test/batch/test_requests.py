@@ -113,7 +113,7 @@ class TestBatchObjects(unittest.TestCase):
     """
 
     @patch("weaviate.batch.requests.uuid4", side_effect=lambda: "d087b7c6a1155c898cb2f25bdeb9bf92")
-    @patch("weaviate.batch.requests.get_vector", side_effect=lambda x: x)
+    @patch("weaviate.batch.requests._get_vector_payload", side_effect=lambda x: x)
     @patch("weaviate.batch.requests.get_valid_uuid", side_effect=lambda x: x)
     def test_add_and_get_request_body(self, mock_get_valid_uuid, mock_get_vector, mock_uuid4):
         """
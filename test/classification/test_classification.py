@@ -51,56 +51,69 @@ class TestClassification(unittest.TestCase):
         result = Classification(mock_conn).get("d087b7c6-a115-5c89-8cb2-f25bdeb9bf92")
         self.assertEqual(result, "OK!")
 
-    @patch("weaviate.classification.classification.Classification._check_status")
-    def test_is_complete(self, mock_check_status):
+    @patch("weaviate.classification.classification.Classification._get_status")
+    def test_is_complete(self, mock_get_status):
         """
         Test the `is_complete` method.
         """
 
-        mock_check_status.return_value = "OK!"
-        result = Classification(None).is_complete("Test!")
-        self.assertEqual(result, "OK!")
-        mock_check_status.assert_called_with("Test!", "completed")
+        mock_get_status.return_value = "completed"
+        self.assertTrue(Classification(None).is_complete("Test!"))
+        mock_get_status.assert_called_with("Test!")
+
+        mock_get_status.return_value = "running"
+        self.assertFalse(Classification(None).is_complete("Test!"))
 
-    @patch("weaviate.classification.classification.Classification._check_status")
-    def test_is_failed(self, mock_check_status):
+        # status could not be retrieved
+        mock_get_status.return_value = None
+        self.assertFalse(Classification(None).is_complete("Test!"))
+
+    @patch("weaviate.classification.classification.Classification._get_status")
+    def test_is_failed(self, mock_get_status):
         """
         Test the `is_failed` method.
         """
 
-        mock_check_status.return_value = "OK!"
-        result = Classification(None).is_failed("Test!")
-        self.assertEqual(result, "OK!")
-        mock_check_status.assert_called_with("Test!", "failed")
+        mock_get_status.return_value = "failed"
+        self.assertTrue(Classification(None).is_failed("Test!"))
+        mock_get_status.assert_called_with("Test!")
 
-    @patch("weaviate.classification.classification.Classification._check_status")
-    def test_is_running(self, mock_check_status):
+        mock_get_status.return_value = "completed"
+        self.assertFalse(Classification(None).is_failed("Test!"))
+
+        # status could not be retrieved
+        mock_get_status.return_value = None
+        self.assertFalse(Classification(None).is_failed("Test!"))
+
+    @patch("weaviate.classification.classification.Classification._get_status")
+    def test_is_running(self, mock_get_status):
         """
         Test the `is_running` method.
         """
 
-        mock_check_status.return_value = "OK!"
-        result = Classification(None).is_running("Test!")
-        self.assertEqual(result, "OK!")
-        mock_check_status.assert_called_with("Test!", "running")
+        mock_get_status.return_value = "running"
+        self.assertTrue(Classification(None).is_running("Test!"))
+        mock_get_status.assert_called_with("Test!")
+
+        mock_get_status.return_value = "failed"
+        self.assertFalse(Classification(None).is_running("Test!"))
+
+        # status could not be retrieved
+        mock_get_status.return_value = None
+        self.assertFalse(Classification(None).is_running("Test!"))
 
     @patch("weaviate.classification.classification.Classification.get")
-    def test__check_status(self, mock_get):
+    def test__get_status(self, mock_get):
         """
-        Test the `_check_status` method.
+        Test the `_get_status` method.
         """
 
-        mock_get.return_value = {"status": "failed"}
-
-        result = Classification(None)._check_status("uuid", "running")
-        self.assertFalse(result)
-
-        result = Classification(None)._check_status("uuid", "failed")
-        self.assertTrue(result)
+        mock_get.return_value = {"status": "running", "id": "uuid"}
+        self.assertEqual(Classification(None)._get_status("uuid"), "running")
+        mock_get.assert_called_once_with("uuid")
 
         mock_get.side_effect = RequestsConnectionError("Test!")
-        result = Classification(None)._check_status("uuid", "running")
-        self.assertFalse(result)
+        self.assertIsNone(Classification(None)._get_status("uuid"))
 
 
 class TestConfigBuilder(unittest.TestCase):
@@ -308,8 +321,39 @@ class TestConfigBuilder(unittest.TestCase):
 
         self.assertEqual(config._config, {})
         self.assertTrue(config._wait_for_completion)
+        self.assertEqual(config._max_poll_interval, 30.0)
+        self.assertEqual(config._poll_backoff_factor, 1.5)
         self.assertIs(result, config)
 
+        config.with_wait_for_completion(max_poll_interval=10, poll_backoff_factor=1)
+        self.assertEqual(config._max_poll_interval, 10)
+        self.assertEqual(config._poll_backoff_factor, 1)
+
+        # invalid polling arguments
+        with self.assertRaises(TypeError) as error:
+            config.with_wait_for_completion(max_poll_interval="10")
+        check_error_message(
+            self, error, "'max_poll_interval' must be of type <class 'numbers.Real'>."
+        )
+        with self.assertRaises(ValueError) as error:
+            config.with_wait_for_completion(max_poll_interval=0)
+        check_error_message(
+            self, error, "'max_poll_interval' must be positive, i.e. greater that zero (>0)."
+        )
+        with self.assertRaises(ValueError) as error:
+            config.with_wait_for_completion(poll_backoff_factor=-1.5)
+        check_error_message(
+            self, error, "'poll_backoff_factor' must be positive, i.e. greater that zero (>0)."
+        )
+        with self.assertRaises(ValueError) as error:
+            config.with_wait_for_completion(poll_backoff_factor=0.5)
+        check_error_message(
+            self,
+            error,
+            "'poll_backoff_factor' must be greater than or equal to one (>=1), otherwise the "
+            "interval between two status checks shrinks.",
+        )
+
     def test_with_settings(self):
         """
         Test the `with_settings` method.
@@ -471,11 +515,13 @@ class TestConfigBuilder(unittest.TestCase):
             path="/classifications", weaviate_object={"class": "TestClass", "type": "TestType"}
         )
 
+    @patch("weaviate.classification.config_builder.random.uniform", return_value=1.0)
+    @patch("weaviate.classification.config_builder.time.sleep")
     @patch("weaviate.classification.config_builder.ConfigBuilder._start")
     @patch(
         "weaviate.classification.config_builder.ConfigBuilder._validate_config", return_value=None
     )
-    def test_do(self, mock_validate_config, mock_start):
+    def test_do(self, mock_validate_config, mock_start, mock_sleep, mock_uniform):
         """
         Test the `do` method.
         """
@@ -483,21 +529,52 @@ class TestConfigBuilder(unittest.TestCase):
         mock_start.return_value = {"status": "test"}
         config = ConfigBuilder(None, None)
         self.assertEqual(config.do(), {"status": "test"})
+        mock_sleep.assert_not_called()
 
         mock_start.return_value = {"status": "test", "id": "test_id"}
         mock_classification = Mock()  # mock self._classification instance
-
-        def mock_waiting(test):
-            if mock_waiting.called:
-                return False
-            mock_waiting.called = True
-            return True
-
-        mock_waiting.called = False  # initialize static variable
-        mock_classification.is_running.side_effect = mock_waiting
-        mock_classification.get.return_value = "test"
+        mock_classification._get_path.return_value = "/classifications/test_id"
+        mock_classification._get_by_path.side_effect = [
+            {"status": "running", "id": "test_id"},
+            {"status": "completed", "id": "test_id"},
+        ]
         config = ConfigBuilder(None, mock_classification).with_wait_for_completion()
-        self.assertEqual(config.do(), "test")
+        # the last polled classification is returned without getting it again
+        self.assertEqual(config.do(), {"status": "completed", "id": "test_id"})
+        # the path is built only once and reused for every poll
+        mock_classification._get_path.assert_called_once_with("test_id")
+        self.assertEqual(mock_classification._get_by_path.call_count, 2)
+        mock_classification._get_by_path.assert_called_with("/classifications/test_id")
+        # the status must not be polled back-to-back
+        mock_sleep.assert_called_once_with(0.3)
+        mock_sleep.reset_mock()
+
+        # the polling interval grows exponentially and is capped
+        mock_classification = Mock()
+        mock_classification._get_by_path.side_effect = [{"status": "running"}] * 6 + [
+            {"status": "failed"}
+        ]
+        config = ConfigBuilder(None, mock_classification).with_wait_for_completion(
+            max_poll_interval=1.0, poll_backoff_factor=2.0
+        )
+        self.assertEqual(config.do(), {"status": "failed"})
+        self.assertEqual(
+            [call_args[0][0] for call_args in mock_sleep.call_args_list],
+            [0.3, 0.6, 1.0, 1.0, 1.0, 1.0],
+        )
+        mock_uniform.assert_called_with(0.75, 1.25)
+        mock_sleep.reset_mock()
+
+        # the jitter is applied to the sleep but not to the backoff
+        mock_uniform.return_value = 0.8
+        mock_classification._get_by_path.side_effect = [{"status": "running"}] * 2 + [
+            {"status": "failed"}
+        ]
+        self.assertEqual(config.do(), {"status": "failed"})
+        self.assertEqual(
+            [call_args[0][0] for call_args in mock_sleep.call_args_list],
+            [0.3 * 0.8, 0.6 * 0.8],
+        )
 
     def test_integration_config(self):
         """
@@ -1,8 +1,17 @@
+import gzip
+import json
+import socket
 import unittest
 from unittest.mock import patch, Mock
 
 from test.util import check_error_message
-from weaviate.connect.connection import BaseConnection, _get_proxies, _get_valid_timeout_config
+from weaviate.connect.connection import (
+    BaseConnection,
+    Connection,
+    _get_proxies,
+    _get_valid_timeout_config,
+)
+from weaviate.exceptions import UnexpectedStatusCodeException
 
 
 class TestConnection(unittest.TestCase):
@@ -23,6 +32,7 @@ class TestConnection(unittest.TestCase):
             headers = {"content-type": "application/json"}
         if url != "skip":
             self.assertEqual(connection.url, url)
+            self.assertEqual(connection._api_url, url + "/v1")
         if timeout_config != "skip":
             self.assertEqual(connection.timeout_config, timeout_config)
         if oidc_auth_flow != "skip":
@@ -49,6 +59,42 @@ class TestConnection(unittest.TestCase):
             additional_headers=None,
         )
 
+        # the connection pool is sized for concurrent requests
+        self.assertEqual(mock_session.mount.call_count, 2)
+        for (prefix, adapter), scheme in zip(
+            [call_args[0] for call_args in mock_session.mount.call_args_list],
+            ["http://", "https://"],
+        ):
+            self.assertEqual(prefix, scheme)
+            self.assertEqual(adapter._pool_maxsize, 100)
+            self.assertIn(
+                (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+                adapter.poolmanager.connection_pool_kw["socket_options"],
+            )
+            # the same holds for the connections through a proxy, the proxy pool is reused
+            proxy_manager = adapter.proxy_manager_for("http://proxy:3128")
+            self.assertIs(proxy_manager, adapter.proxy_manager_for("http://proxy:3128"))
+            self.assertIn(
+                (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+                proxy_manager.connection_pool_kw["socket_options"],
+            )
+            self.assertEqual(proxy_manager.connection_pool_kw["maxsize"], 100)
+            # only the idempotent requests are retried on transient failures
+            self.assertEqual(adapter.max_retries.total, 3)
+            self.assertTrue(adapter.max_retries.is_retry("DELETE", 503))
+            self.assertFalse(adapter.max_retries.is_retry("POST", 503))
+            self.assertFalse(adapter.max_retries.is_retry("GET", 500))
+            self.assertFalse(adapter.max_retries.read)
+
+        # the OpenID discovery is done with the same session that is used for the requests
+        mock_session.get.assert_called_once_with(
+            "http://weaviate:1234/v1/.well-known/openid-configuration",
+            headers={"content-type": "application/json"},
+            timeout=(2, 20),
+            proxies={},
+        )
+        mock_session.reset_mock()
+
         # GET method with param
         connection.get("/get", {"test": None}),
         mock_session.get.assert_called_with(
@@ -75,7 +121,7 @@ class TestConnection(unittest.TestCase):
         connection.put("/put", {"PUT": "test"}),
         mock_session.put.assert_called_with(
             url="http://weaviate:1234/v1/put",
-            json={"PUT": "test"},
+            data=b'{"PUT":"test"}',
             headers={"content-type": "application/json"},
             timeout=(2, 20),
             proxies={},
@@ -86,18 +132,40 @@ class TestConnection(unittest.TestCase):
         connection.post("/post", {"POST": "TeST!"}),
         mock_session.post.assert_called_with(
             url="http://weaviate:1234/v1/post",
-            json={"POST": "TeST!"},
+            data=b'{"POST":"TeST!"}',
             headers={"content-type": "application/json"},
             timeout=(2, 20),
             proxies={},
         )
         mock_session.reset_mock()
 
+        # POST method with compression, small body is sent uncompressed
+        connection.post("/post", {"POST": "TeST!"}, compress=True),
+        mock_session.post.assert_called_with(
+            url="http://weaviate:1234/v1/post",
+            data=b'{"POST":"TeST!"}',
+            headers={"content-type": "application/json"},
+            timeout=(2, 20),
+            proxies={},
+        )
+        mock_session.reset_mock()
+
+        # POST method with compression, large body is gzipped
+        large_object = {"POST": "a" * 70_000}
+        connection.post("/post", large_object, compress=True),
+        call_kwargs = mock_session.post.call_args[1]
+        self.assertEqual(
+            call_kwargs["headers"],
+            {"content-type": "application/json", "content-encoding": "gzip"},
+        )
+        self.assertEqual(json.loads(gzip.decompress(call_kwargs["data"])), large_object)
+        mock_session.reset_mock()
+
         # PATCH method
         connection.patch("/patch", {"PATCH": "teST"}),
         mock_session.patch.assert_called_with(
             url="http://weaviate:1234/v1/patch",
-            json={"PATCH": "teST"},
+            data=b'{"PATCH":"teST"}',
             headers={"content-type": "application/json"},
             timeout=(2, 20),
             proxies={},
@@ -108,7 +176,7 @@ class TestConnection(unittest.TestCase):
         connection.delete("/delete", {"DELETE": "TESt"}),
         mock_session.delete.assert_called_with(
             url="http://weaviate:1234/v1/delete",
-            json={"DELETE": "TESt"},
+            data=b'{"DELETE":"TESt"}',
             headers={"content-type": "application/json"},
             timeout=(2, 20),
             proxies={},
@@ -152,7 +220,7 @@ class TestConnection(unittest.TestCase):
         connection.put("/put", {"PUT": "test"}),
         mock_session.put.assert_called_with(
             url="http://weaviate:1234/v1/put",
-            json={"PUT": "test"},
+            data=b'{"PUT":"test"}',
             headers={"content-type": "application/json"},
             timeout=(2, 20),
             proxies={"test": True},
@@ -163,7 +231,7 @@ class TestConnection(unittest.TestCase):
         connection.post("/post", {"POST": "TeST!"}),
         mock_session.post.assert_called_with(
             url="http://weaviate:1234/v1/post",
-            json={"POST": "TeST!"},
+            data=b'{"POST":"TeST!"}',
             headers={"content-type": "application/json"},
             timeout=(2, 20),
             proxies={"test": True},
@@ -174,7 +242,7 @@ class TestConnection(unittest.TestCase):
         connection.patch("/patch", {"PATCH": "teST"}),
         mock_session.patch.assert_called_with(
             url="http://weaviate:1234/v1/patch",
-            json={"PATCH": "teST"},
+            data=b'{"PATCH":"teST"}',
             headers={"content-type": "application/json"},
             timeout=(2, 20),
             proxies={"test": True},
@@ -185,7 +253,7 @@ class TestConnection(unittest.TestCase):
         connection.delete("/delete", {"DELETE": "TESt"}),
         mock_session.delete.assert_called_with(
             url="http://weaviate:1234/v1/delete",
-            json={"DELETE": "TESt"},
+            data=b'{"DELETE":"TESt"}',
             headers={"content-type": "application/json"},
             timeout=(2, 20),
             proxies={"test": True},
@@ -213,6 +281,46 @@ class TestConnection(unittest.TestCase):
         connection.timeout_config = (4, 210)
         self.assertEqual(connection.timeout_config, (4, 210))
 
+    @patch("weaviate.util.time.monotonic", return_value=100.0)
+    @patch("weaviate.connect.connection.BaseConnection.get")
+    @patch("weaviate.connect.connection.BaseConnection._create_session")
+    def test_get_meta(self, mock_create_session, mock_get, mock_monotonic):
+        """
+        Test the `get_meta` method and `server_version` property.
+        """
+
+        mock_get.return_value = Mock(status_code=200)
+        mock_get.return_value.json.return_value = {"version": "1.17.0"}
+        connection = Connection(
+            url="http://test_url",
+            auth_client_secret=None,
+            timeout_config=(2, 20),
+            proxies=None,
+            trust_env=False,
+            additional_headers=None,
+        )
+        mock_get.assert_called_once_with(path="/meta")
+
+        # the meta is reused until it expires
+        mock_monotonic.return_value = 159.0
+        self.assertEqual(connection.get_meta(), {"version": "1.17.0"})
+        self.assertEqual(connection.server_version, "1.17.0")
+        mock_get.assert_called_once_with(path="/meta")
+
+        mock_monotonic.return_value = 161.0
+        mock_get.return_value.json.return_value = {"version": "1.18.0"}
+        self.assertEqual(connection.server_version, "1.18.0")
+        self.assertEqual(mock_get.call_count, 2)
+
+        # errors are not cached
+        mock_monotonic.return_value = 500.0
+        mock_get.return_value = Mock(status_code=500)
+        with self.assertRaises(UnexpectedStatusCodeException):
+            connection.get_meta()
+        with self.assertRaises(UnexpectedStatusCodeException):
+            connection.get_meta()
+        self.assertEqual(mock_get.call_count, 4)
+
     @patch("weaviate.connect.connection.datetime")
     def test_get_epoch_time(self, mock_datetime):
         """
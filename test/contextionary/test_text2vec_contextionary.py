@@ -1,9 +1,16 @@
+import time
 import unittest
-from unittest.mock import Mock
+from threading import Event
+from unittest.mock import Mock, patch
 
 from requests.exceptions import ConnectionError as RequestsConnectionError
 
-from test.util import mock_connection_func, check_error_message, check_startswith_error_message
+from test.util import (
+    call_concurrently,
+    mock_connection_func,
+    check_error_message,
+    check_startswith_error_message,
+)
 from weaviate.contextionary import Contextionary
 from weaviate.exceptions import UnexpectedStatusCodeException
 
@@ -64,11 +71,14 @@ class TestText2VecContextionary(unittest.TestCase):
             contextionary.extend(**some_concept)
         check_error_message(self, error, requests_error_message)
 
-        ## test valid call without specifying 'weight'
+        ## test valid call without specifying 'weight', the cached vectors are invalidated
         some_concept["weight"] = 1.0
         connection_mock = mock_connection_func("post", status_code=200)
         contextionary = Contextionary(connection_mock)
+        contextionary.enable_concept_vector_cache()
+        contextionary._concept_vector_cache.put("palantir", {})
         contextionary.extend(**some_concept)
+        self.assertEqual(len(contextionary._concept_vector_cache), 0)
         connection_mock.post.assert_called_with(
             path="/modules/text2vec-contextionary/extensions",
             weaviate_object=some_concept,
@@ -98,6 +108,57 @@ class TestText2VecContextionary(unittest.TestCase):
             path="/modules/text2vec-contextionary/concepts/sauce",
         )
 
+        # not cached by default
+        self.assertEqual("B", contextionary.get_concept_vector("sauce")["A"])
+        self.assertEqual(connection_mock.get.call_count, 2)
+
+        # test cached call, the caller gets its own copy
+        connection_mock = mock_connection_func("get", return_json={"A": "B"})
+        contextionary = Contextionary(connection_mock)
+        contextionary.enable_concept_vector_cache()
+        contextionary.get_concept_vector("sauce")["A"] = "C"
+        self.assertEqual("B", contextionary.get_concept_vector("sauce")["A"])
+        self.assertEqual(connection_mock.get.call_count, 1)
+
+        # test invalidated cache
+        contextionary.invalidate_concept_vector_cache("pasta")
+        contextionary.get_concept_vector("sauce")
+        self.assertEqual(connection_mock.get.call_count, 1)
+        contextionary.invalidate_concept_vector_cache("sauce")
+        contextionary.get_concept_vector("sauce")
+        self.assertEqual(connection_mock.get.call_count, 2)
+        contextionary.invalidate_concept_vector_cache()
+        contextionary.get_concept_vector("sauce")
+        self.assertEqual(connection_mock.get.call_count, 3)
+
+        # test least recently used concept is evicted
+        contextionary.enable_concept_vector_cache(maxsize=2)
+        contextionary.get_concept_vector("pasta")
+        contextionary.get_concept_vector("sauce")
+        contextionary.get_concept_vector("pizza")  # evicts 'pasta'
+        self.assertEqual(connection_mock.get.call_count, 6)
+        contextionary.get_concept_vector("sauce")
+        self.assertEqual(connection_mock.get.call_count, 6)
+        contextionary.get_concept_vector("pasta")
+        self.assertEqual(connection_mock.get.call_count, 7)
+
+        # test expired concept vectors are retrieved again
+        with patch("weaviate.util.time.monotonic", return_value=time.monotonic() + 601):
+            contextionary.get_concept_vector("pasta")
+        self.assertEqual(connection_mock.get.call_count, 8)
+
+        # test disabled cache
+        contextionary.disable_concept_vector_cache()
+        contextionary.get_concept_vector("pasta")
+        self.assertEqual(connection_mock.get.call_count, 9)
+        contextionary.invalidate_concept_vector_cache()
+
+        # test invalid cache arguments
+        with self.assertRaises(ValueError):
+            contextionary.enable_concept_vector_cache(maxsize=0)
+        with self.assertRaises(TypeError):
+            contextionary.enable_concept_vector_cache(ttl="1")
+
         # test exceptions
 
         # error messages
@@ -117,3 +178,38 @@ class TestText2VecContextionary(unittest.TestCase):
         with self.assertRaises(RequestsConnectionError) as error:
             contextionary.get_concept_vector("Palantir")
         check_error_message(self, error, requests_error_message)
+
+    def test_get_concept_vector_concurrent(self):
+        """
+        Test that concurrent `get_concept_vector` calls for one concept share one request if cached.
+        """
+
+        release = Event()
+        response = Mock(status_code=200, content=b'{"A": "B"}')
+        response.json.return_value = {"A": "B"}
+
+        def blocking_get(path):
+            release.wait(5)
+            return response
+
+        connection_mock = mock_connection_func("get", side_effect=blocking_get)
+        contextionary = Contextionary(connection_mock)
+        contextionary.enable_concept_vector_cache()
+        futures = call_concurrently(lambda: contextionary.get_concept_vector("sauce"), 4, release)
+        results = [future.result() for future in futures]
+        self.assertEqual(results, [{"A": "B"}] * 4)
+        self.assertEqual(connection_mock.get.call_count, 1)
+        self.assertEqual(len(contextionary._concept_vector_requests), 0)
+
+        # errors are raised for all waiting calls and are not cached
+        release.clear()
+        connection_mock = mock_connection_func("get", status_code=404)
+        connection_mock.get.side_effect = lambda path: release.wait(5) and Mock(status_code=404)
+        contextionary = Contextionary(connection_mock)
+        contextionary.enable_concept_vector_cache()
+        futures = call_concurrently(lambda: contextionary.get_concept_vector("sauce"), 2, release)
+        for future in futures:
+            with self.assertRaises(UnexpectedStatusCodeException):
+                future.result()
+        self.assertEqual(connection_mock.get.call_count, 1)
+        self.assertEqual(len(contextionary._concept_vector_cache), 0)
@@ -3,9 +3,14 @@ from unittest.mock import Mock
 
 from requests.exceptions import ConnectionError as RequestsConnectionError
 
-from test.util import mock_connection_func, check_error_message, check_startswith_error_message
+from test.util import (
+    concurrent_call_count,
+    mock_connection_func,
+    check_error_message,
+    check_startswith_error_message,
+)
 from weaviate.data.references import Reference
-from weaviate.exceptions import UnexpectedStatusCodeException
+from weaviate.exceptions import UnexpectedStatusCodeException, WeaviateBaseError
 
 
 class TestReference(unittest.TestCase):
@@ -285,3 +290,115 @@ class TestReference(unittest.TestCase):
                 {"beacon": "weaviate://localhost/d671dc52-dce4-46e7-8731-b722f19420c8"},
             ],
         )
+
+    def test_add_many(self):
+        """
+        Test `add_many` method.
+        """
+
+        unexpected_error_msg = "Add property references to objects"
+        connection_error_msg = "References were not added."
+
+        # invalid calls
+        reference = Reference(Mock(server_version="1.14.1"))
+        valid_reference = {
+            "from_uuid": self.uuid_1,
+            "from_property_name": "prop",
+            "to_uuid": self.uuid_2,
+            "from_class_name": "Author",
+        }
+        with self.assertRaises(TypeError) as error:
+            reference.add_many([{**valid_reference, "from_property_name": 1}])
+        check_error_message(self, error, self.name_error_message(int))
+
+        with self.assertRaises(TypeError) as error:
+            reference.add_many([{**valid_reference, "from_class_name": None}])
+        check_error_message(
+            self, error, f"'from_class_name' must be of type 'str'. Given type: {type(None)}"
+        )
+
+        with self.assertRaises(ValueError) as error:
+            reference.add_many([{**valid_reference, "from_uuid": "my UUID"}])
+        check_error_message(self, error, self.valid_uuid_error_message)
+
+        references = [
+            {
+                "from_uuid": self.uuid_1,
+                "from_property_name": "wroteBooks",
+                "to_uuid": self.uuid_2,
+                "from_class_name": "author",
+                "to_class_name": "book",
+            },
+            {
+                "from_uuid": self.uuid_2,
+                "from_property_name": "wroteBooks",
+                "to_uuid": self.uuid_1,
+                "from_class_name": "Author",
+            },
+        ]
+
+        mock_obj = mock_connection_func("post", status_code=204, server_version="1.14.1")
+        reference = Reference(mock_obj)
+        with self.assertRaises(UnexpectedStatusCodeException) as error:
+            reference.add_many(references)
+        check_startswith_error_message(self, error, unexpected_error_msg)
+
+        mock_obj = mock_connection_func(
+            "post",
+            return_json=[
+                {"from": "a", "to": "b", "result": {}},
+                {"from": "c", "to": "d", "result": {"errors": {"error": [{"message": "x"}]}}},
+            ],
+            server_version="1.14.1",
+        )
+        reference = Reference(mock_obj)
+        with self.assertRaises(WeaviateBaseError) as error:
+            reference.add_many(references)
+        check_error_message(self, error, "Adding 1 of 2 references failed: c -> d: x")
+
+        mock_obj = mock_connection_func(
+            "post", side_effect=RequestsConnectionError("Test!"), server_version="1.14.1"
+        )
+        reference = Reference(mock_obj)
+        with self.assertRaises(RequestsConnectionError) as error:
+            reference.add_many(references)
+        check_error_message(self, error, connection_error_msg)
+
+        # valid calls
+        connection_mock = mock_connection_func(
+            "post", return_json=[{"result": {}}, {"result": {}}], server_version="1.14.1"
+        )
+        reference = Reference(connection_mock)
+
+        reference.add_many([])
+        connection_mock.post.assert_not_called()
+
+        reference.add_many(references)
+        connection_mock.post.assert_called_once_with(
+            path="/batch/references",
+            weaviate_object=[
+                {
+                    "from": f"weaviate://localhost/Author/{self.uuid_1}/wroteBooks",
+                    "to": f"weaviate://localhost/Book/{self.uuid_2}",
+                },
+                {
+                    "from": f"weaviate://localhost/Author/{self.uuid_2}/wroteBooks",
+                    "to": f"weaviate://localhost/{self.uuid_1}",
+                },
+            ],
+        )
+
+        # the references are split into batches, sent concurrently
+        connection_mock.post.reset_mock()
+        reference.add_many(references + references[:1], batch_size=2, concurrency=2)
+        self.assertEqual(concurrent_call_count(connection_mock.post), 2)
+        self.assertEqual(
+            sorted(len(call[1]["weaviate_object"]) for call in connection_mock.post.call_args_list),
+            [1, 2],
+        )
+
+        with self.assertRaises(ValueError) as error:
+            reference.add_many(references, batch_size=0)
+        check_error_message(
+            self, error, "'batch_size' must be positive, i.e. greater that zero (>0)."
+        )
@@ -1,21 +1,31 @@
+import concurrent.futures
 import unittest
+from threading import Event
 from unittest.mock import patch, Mock
 
 from requests.exceptions import ConnectionError as RequestsConnectionError
 
-from test.util import mock_connection_func, check_error_message, check_startswith_error_message
+from test.util import (
+    call_concurrently,
+    concurrent_call_count,
+    mock_connection_func,
+    check_error_message,
+    check_startswith_error_message,
+    wait_until,
+)
 from weaviate.data import DataObject
 from weaviate.data.replication import ConsistencyLevel
 from weaviate.exceptions import (
     UnexpectedStatusCodeException,
     ObjectAlreadyExistsException,
+    WeaviateBaseError,
 )
 
 
 class TestDataObject(unittest.TestCase):
     @patch("weaviate.data.crud_data._get_dict_from_object", side_effect=lambda x: x)
     @patch("weaviate.data.crud_data.get_valid_uuid", side_effect=lambda x: x)
-    @patch("weaviate.data.crud_data.get_vector", side_effect=lambda x: x)
+    @patch("weaviate.data.crud_data._get_vector_payload", side_effect=lambda x: x)
     def test_create(self, mock_get_vector, mock_get_valid_uuid, mock_get_dict_from_object):
         """
         Test the `create` method.
@@ -66,7 +76,7 @@ class TestDataObject(unittest.TestCase):
 
         reset()
         mock_obj = mock_connection_func(
-            "post", status_code=204, return_json={"error": [{"message": "already exists"}]}
+            "post", status_code=422, return_json={"error": [{"message": "already exists"}]}
         )
         data_object = DataObject(mock_obj)
         with self.assertRaises(ObjectAlreadyExistsException) as error:
@@ -76,6 +86,19 @@ class TestDataObject(unittest.TestCase):
         mock_get_vector.assert_not_called()
         mock_get_valid_uuid.assert_not_called()
 
+        reset()
+        # other status codes are not reported as existing objects
+        mock_obj = mock_connection_func(
+            "post", status_code=500, return_json={"error": [{"message": "already exists"}]}
+        )
+        data_object = DataObject(mock_obj)
+        with self.assertRaises(UnexpectedStatusCodeException) as error:
+            data_object.create({"name": "Alan Greenspan"}, "CoolestPersonEver")
+        check_startswith_error_message(self, error, "Creating object")
+        mock_get_dict_from_object.assert_called()
+        mock_get_vector.assert_not_called()
+        mock_get_valid_uuid.assert_not_called()
+
         reset()
         mock_obj = mock_connection_func("post", status_code=204, return_json={})
         data_object = DataObject(mock_obj)
@@ -86,6 +109,14 @@ class TestDataObject(unittest.TestCase):
         mock_get_vector.assert_not_called()
         mock_get_valid_uuid.assert_not_called()
 
+        reset()
+        # malformed error bodies are reported as unexpected status codes
+        mock_obj = mock_connection_func("post", status_code=422, return_json={"error": []})
+        data_object = DataObject(mock_obj)
+        with self.assertRaises(UnexpectedStatusCodeException) as error:
+            data_object.create({"name": "Alan Greenspan"}, "CoolestPersonEver")
+        check_startswith_error_message(self, error, "Creating object")
+
         # # test valid calls
         ## without vector argument
         connection_mock = mock_connection_func("post", return_json={"id": 0}, status_code=200)
@@ -139,7 +170,114 @@ class TestDataObject(unittest.TestCase):
         mock_get_valid_uuid.assert_called()
 
     @patch("weaviate.data.crud_data._get_dict_from_object", side_effect=lambda x: x)
-    @patch("weaviate.data.crud_data.get_vector", side_effect=lambda x: x)
+    @patch("weaviate.data.crud_data.get_valid_uuid", side_effect=lambda x: x)
+    @patch("weaviate.data.crud_data._get_vector_payload", side_effect=lambda x: x)
+    def test_create_many(self, mock_get_vector, mock_get_valid_uuid, mock_get_dict_from_object):
+        """
+        Test the `create_many` method.
+        """
+
+        objects = [
+            {"data_object": {"name": "Neil Gaiman"}, "class_name": "author"},
+            {
+                "data_object": {"name": "Andrzej Sapkowski"},
+                "class_name": "Author",
+                "uuid": "e067f671-1202-42c6-848b-ff4d1eb804ab",
+                "vector": [1.0, 2.0],
+            },
+        ]
+        rest_objects = [
+            {"class": "Author", "properties": {"name": "Neil Gaiman"}},
+            {
+                "class": "Author",
+                "properties": {"name": "Andrzej Sapkowski"},
+                "id": "e067f671-1202-42c6-848b-ff4d1eb804ab",
+                "vector": [1.0, 2.0],
+            },
+        ]
+
+        # test exceptions
+        with self.assertRaises(TypeError) as error:
+            DataObject(Mock()).create_many([{"data_object": {}, "class_name": 1}])
+        check_error_message(self, error, "Expected class_name of type str but was: <class 'int'>")
+
+        mock_obj = mock_connection_func("post", side_effect=RequestsConnectionError("Test!"))
+        with self.assertRaises(RequestsConnectionError) as error:
+            DataObject(mock_obj).create_many(objects)
+        check_error_message(self, error, "Objects were not added to Weaviate.")
+
+        mock_obj = mock_connection_func("post", status_code=500)
+        with self.assertRaises(UnexpectedStatusCodeException) as error:
+            DataObject(mock_obj).create_many(objects)
+        check_startswith_error_message(self, error, "Creating objects")
+
+        return_json = [
+            {"id": "1", "result": {}},
+            {
+                "id": "e067f671-1202-42c6-848b-ff4d1eb804ab",
+                "result": {"errors": {"error": [{"message": "id already exists"}]}},
+            },
+        ]
+        mock_obj = mock_connection_func("post", return_json=return_json)
+        with self.assertRaises(WeaviateBaseError) as error:
+            DataObject(mock_obj).create_many(objects)
+        check_error_message(
+            self,
+            error,
+            "Creating 1 of 2 objects failed: "
+            "e067f671-1202-42c6-848b-ff4d1eb804ab: id already exists",
+        )
+
+        # test valid calls
+        mock_obj = mock_connection_func()
+        self.assertEqual(DataObject(mock_obj).create_many([]), [])
+        mock_obj.post.assert_not_called()
+
+        return_json = [{"id": "1", "result": {}}, {"id": "e067f671-1202-42c6-848b-ff4d1eb804ab"}]
+        mock_obj = mock_connection_func("post", return_json=return_json)
+        self.assertEqual(
+            DataObject(mock_obj).create_many(objects),
+            ["1", "e067f671-1202-42c6-848b-ff4d1eb804ab"],
+        )
+        mock_obj.post.assert_called_once_with(
+            path="/batch/objects",
+            weaviate_object={"fields": ["ALL"], "objects": rest_objects},
+        )
+
+        # objects are sent in batches of up to `batch_size` objects
+        def post(path, weaviate_object):
+            return_json = [
+                {"id": object_["properties"]["name"]} for object_ in weaviate_object["objects"]
+            ]
+            return mock_connection_func("post", return_json=return_json).post()
+
+        names = [str(i) for i in range(5)]
+        objects = [{"data_object": {"name": name}, "class_name": "Test"} for name in names]
+        for batch_size, concurrency, expected_sizes in [
+            (2, 1, [2, 2, 1]),
+            (5, 2, [5]),
+            (3, 2, [3, 2]),
+        ]:
+            mock_obj = mock_connection_func()
+            mock_obj.post.side_effect = post
+            result = DataObject(mock_obj).create_many(
+                objects, batch_size=batch_size, concurrency=concurrency
+            )
+            self.assertEqual(result, names)
+            calls = mock_obj.post.call_args_list
+            self.assertEqual(
+                sorted(len(call[1]["weaviate_object"]["objects"]) for call in calls),
+                sorted(expected_sizes),
+            )
+
+        with self.assertRaises(ValueError) as error:
+            DataObject(mock_obj).create_many(objects, batch_size=0)
+        check_error_message(
+            self, error, "'batch_size' must be positive, i.e. greater that zero (>0)."
+        )
+
+    @patch("weaviate.data.crud_data._get_dict_from_object", side_effect=lambda x: x)
+    @patch("weaviate.data.crud_data._get_vector_payload", side_effect=lambda x: x)
     def test_update(self, mock_get_vector, mock_get_dict_from_object):
         """
         Test the `update` method.
@@ -246,8 +384,44 @@ class TestDataObject(unittest.TestCase):
         mock_get_dict_from_object.assert_called()
         mock_get_vector.assert_called()
 
+    def test_update_many(self):
+        """
+        Test the `update_many` method.
+        """
+
+        uuids = [f"1d420c9c-98cb-11ec-9db6-1e008a366d4{i}" for i in range(3)]
+        objects = [
+            {"data_object": {"name": str(i)}, "class_name": "test", "uuid": uuid}
+            for i, uuid in enumerate(uuids)
+        ]
+
+        connection_mock = mock_connection_func("patch", status_code=204)
+        self.assertIsNone(DataObject(connection_mock).update_many(objects, concurrency=2))
+        self.assertEqual(
+            sorted(
+                (call[1]["path"], call[1]["weaviate_object"]["properties"]["name"])
+                for call in connection_mock.patch.call_args_list
+            ),
+            [(f"/objects/{uuid}", str(i)) for i, uuid in enumerate(uuids)],
+        )
+
+        # all updates are sent even if one fails, also those waiting for a free worker
+        uuids = [f"1d420c9c-98cb-11ec-9db6-1e008a366d{i:02}" for i in range(20)]
+        objects = [{"data_object": {}, "class_name": "test", "uuid": uuid} for uuid in uuids]
+        connection_mock = mock_connection_func()
+        connection_mock.patch.side_effect = lambda path, weaviate_object: Mock(
+            status_code=404 if path.endswith(uuids[0]) else 204, json=Mock(return_value=None)
+        )
+        with self.assertRaises(UnexpectedStatusCodeException) as error:
+            DataObject(connection_mock).update_many(objects, concurrency=2)
+        check_startswith_error_message(self, error, "Update of the object not successful")
+        self.assertEqual(
+            sorted(call[1]["path"] for call in connection_mock.patch.call_args_list),
+            [f"/objects/{uuid}" for uuid in uuids],
+        )
+
     @patch("weaviate.data.crud_data._get_dict_from_object", side_effect=lambda x: x)
-    @patch("weaviate.data.crud_data.get_vector", side_effect=lambda x: x)
+    @patch("weaviate.data.crud_data._get_vector_payload", side_effect=lambda x: x)
     def test_replace(self, mock_get_vector, mock_get_dict_from_object):
         """
         Test the `replace` method.
@@ -508,6 +682,64 @@ class TestDataObject(unittest.TestCase):
             path="/objects/1d420c9c-98cb-11ec-9db6-1e008a366d49", params={"include": "test1,test2"}
         )
 
+        connection_mock = mock_connection_func("get", return_json={"objects": []})
+        data_object = DataObject(connection_mock)
+        data_object.get(class_name="Test", after="1d420c9c98cb11ec9db61e008a366d49", limit=2)
+        connection_mock.get.assert_called_with(
+            path="/objects",
+            params={
+                "include": "test1,test2",
+                "limit": 2,
+                "after": "1d420c9c-98cb-11ec-9db6-1e008a366d49",
+            },
+        )
+
+    def test_get_iterator(self):
+        """
+        Test the `get_iterator` method.
+        """
+
+        uuids = [f"1d420c9c-98cb-11ec-9db6-1e008a366d4{i}" for i in range(5)]
+
+        # test exceptions
+        with self.assertRaises(TypeError) as error:
+            next(DataObject(Mock()).get_iterator(class_name=1))
+        check_error_message(
+            self, error, "'class_name' must be of type str. Given type: <class 'int'>"
+        )
+
+        with self.assertRaises(ValueError) as error:
+            next(DataObject(Mock()).get_iterator(class_name="Test", batch_size=0))
+        check_error_message(
+            self, error, "'batch_size' must be positive, i.e. greater that zero (>0)."
+        )
+
+        # test valid calls
+        def get(path, params):
+            start = 0 if "after" not in params else uuids.index(params["after"]) + 1
+            end = start + params["limit"]
+            objects = [{"id": uuid} for uuid in uuids[start:end]]
+            return mock_connection_func("get", return_json={"objects": objects}).get()
+
+        for batch_size, expected_afters in [
+            (2, [None, uuids[1], uuids[3]]),
+            (5, [None, uuids[4]]),
+            (10, [None]),
+        ]:
+            connection_mock = mock_connection_func(server_version="1.18.0")
+            connection_mock.get.side_effect = get
+            result = DataObject(connection_mock).get_iterator(
+                class_name="Test", batch_size=batch_size, with_vector=True
+            )
+            self.assertEqual([object_["id"] for object_ in result], uuids)
+            calls = connection_mock.get.call_args_list
+            self.assertEqual([call[1]["params"].get("after") for call in calls], expected_afters)
+            for call in calls:
+                self.assertEqual(call[1]["path"], "/objects")
+                self.assertEqual(call[1]["params"]["class"], "Test")
+                self.assertEqual(call[1]["params"]["include"], "vector")
+                self.assertEqual(call[1]["params"]["limit"], batch_size)
+
     def test_exists(self):
         """
         Test the `exists` method.
@@ -548,8 +780,322 @@ class TestDataObject(unittest.TestCase):
             path="/objects/1d420c9c-98cb-11ec-9db6-1e008a366d49",
         )
 
+    def test_get_many(self):
+        """
+        Test the `get_many` method.
+        """
+
+        uuids = [f"1d420c9c-98cb-11ec-9db6-1e008a366d4{i}" for i in range(5)]
+
+        def get(path, params):
+            uuid = path.split("/")[-1]
+            if uuid == uuids[3]:
+                return mock_connection_func("get", status_code=404).get()
+            return mock_connection_func("get", return_json={"id": uuid}).get()
+
+        connection_mock = mock_connection_func()
+        connection_mock.get.side_effect = get
+        result = DataObject(connection_mock).get_many(uuids, with_vector=True, concurrency=2)
+        self.assertEqual(result, [{"id": uuid} for uuid in uuids[:3]] + [None, {"id": uuids[4]}])
+        self.assertEqual(concurrent_call_count(connection_mock.get), 5)
+        connection_mock.get.assert_any_call(
+            path=f"/objects/{uuids[4]}", params={"include": "vector"}
+        )
+
+        self.assertEqual(DataObject(connection_mock).get_many([]), [])
+
+        result = DataObject(connection_mock).get_many(uuids[2:4], stream=True)
+        self.assertEqual(dict(result), {uuids[2]: {"id": uuids[2]}, uuids[3]: None})
+
+        with self.assertRaises(ValueError) as error:
+            DataObject(connection_mock).get_many(uuids, concurrency=0)
+        check_error_message(
+            self, error, "'concurrency' must be positive, i.e. greater that zero (>0)."
+        )
+
+        connection_mock = mock_connection_func("get", side_effect=RequestsConnectionError("Test!"))
+        with self.assertRaises(RequestsConnectionError) as error:
+            DataObject(connection_mock).get_many(uuids)
+        check_error_message(self, error, "Could not get object/s.")
+
+    def test_delete_many(self):
+        """
+        Test the `delete_many` method.
+        """
+
+        uuids = [f"1d420c9c-98cb-11ec-9db6-1e008a366d4{i}" for i in range(5)]
+
+        connection_mock = mock_connection_func("delete", status_code=204)
+        self.assertIsNone(DataObject(connection_mock).delete_many(uuids))
+        self.assertEqual(
+            sorted(call[1]["path"] for call in connection_mock.delete.call_args_list),
+            [f"/objects/{uuid}" for uuid in uuids],
+        )
+
+        connection_mock = mock_connection_func("delete", status_code=404)
+        with self.assertRaises(UnexpectedStatusCodeException) as error:
+            DataObject(connection_mock).delete_many(uuids)
+        check_startswith_error_message(self, error, "Delete object")
+
+    def test_exists_many(self):
+        """
+        Test the `exists_many` method.
+        """
+
+        uuids = [f"1d420c9c-98cb-11ec-9db6-1e008a366d4{i}" for i in range(5)]
+
+        def head(path):
+            status_code = 404 if path.endswith(uuids[1]) else 204
+            return mock_connection_func("head", status_code=status_code).head()
+
+        connection_mock = mock_connection_func()
+        connection_mock.head.side_effect = head
+        self.assertEqual(
+            DataObject(connection_mock).exists_many(uuids),
+            [True, False, True, True, True],
+        )
+        self.assertEqual(concurrent_call_count(connection_mock.head), 5)
+
+        # stream the results in completion order
+        result = DataObject(connection_mock).exists_many(uuids, concurrency=2, stream=True)
+        self.assertEqual(
+            sorted(result),
+            sorted(zip(uuids, [True, False, True, True, True])),
+        )
+        self.assertEqual(concurrent_call_count(connection_mock.head), 10)
+        self.assertEqual(list(DataObject(connection_mock).exists_many([], stream=True)), [])
+
+        # invalid arguments are reported before iterating
+        with self.assertRaises(ValueError):
+            DataObject(connection_mock).exists_many(uuids, concurrency=0, stream=True)
+
+        # errors stop the iteration and the remaining requests are not sent
+        futures = {}
+
+        def as_completed(futures_):
+            futures.update(futures_)
+            return concurrent.futures.as_completed(futures_)
+
+        def failing_head(path):
+            if path.endswith(uuids[0]):
+                return mock_connection_func("head", status_code=500).head()
+            # do not let the next request finish before the ones after it are cancelled
+            wait_until(lambda: sum(future.cancelled() for future in futures) >= 3)
+            return mock_connection_func("head", status_code=204).head()
+
+        connection_mock = mock_connection_func()
+        connection_mock.head.side_effect = failing_head
+        result = DataObject(connection_mock).exists_many(uuids, concurrency=1, stream=True)
+        with patch("weaviate.util.as_completed", side_effect=as_completed):
+            with self.assertRaises(UnexpectedStatusCodeException):
+                list(result)
+        # the request after the failed one might have started before the error was seen
+        self.assertLessEqual(connection_mock.head.call_count, 2)
+        self.assertGreaterEqual(sum(future.cancelled() for future in futures), 3)
+
+    def test_validation_cache(self):
+        """
+        Test the `enable_validation_cache` and `disable_validation_cache` methods.
+        """
+
+        with self.assertRaises(ValueError) as error:
+            DataObject(Mock()).enable_validation_cache(maxsize=0)
+        check_error_message(self, error, "'maxsize' must be positive, i.e. greater that zero (>0).")
+
+        connection_mock = mock_connection_func("post", status_code=200)
+        data_object = DataObject(connection_mock)
+        expected = {"error": None, "valid": True}
+
+        # validations are not cached by default
+        self.assertEqual(data_object.validate({"name": "Test"}, "Test"), expected)
+        self.assertEqual(data_object.validate({"name": "Test"}, "Test"), expected)
+        self.assertEqual(connection_mock.post.call_count, 2)
+
+        data_object.enable_validation_cache()
+        self.assertEqual(data_object.validate({"name": "Test"}, "Test"), expected)
+        self.assertEqual(data_object.validate({"name": "Test"}, "test"), expected)
+        self.assertEqual(connection_mock.post.call_count, 3)
+        # any other object is validated again
+        data_object.validate({"name": "Other"}, "Test")
+        data_object.validate({"name": "Test"}, "Other")
+        data_object.validate({"name": "Test"}, "Test", vector=[1.0])
+        self.assertEqual(connection_mock.post.call_count, 6)
+
+        # invalid objects are not cached
+        connection_mock = mock_connection_func("post", status_code=422, return_json={"error": []})
+        data_object = DataObject(connection_mock)
+        data_object.enable_validation_cache()
+        data_object.validate({"name": "Test"}, "Test")
+        data_object.validate({"name": "Test"}, "Test")
+        self.assertEqual(connection_mock.post.call_count, 2)
+
+        data_object.disable_validation_cache()
+        self.assertIsNone(data_object._validation_cache)
+
+        # the cache can be disabled while a validation is in flight
+        def post(path, weaviate_object):
+            data_object.disable_validation_cache()
+            return mock_connection_func("post", status_code=200).post()
+
+        connection_mock = mock_connection_func()
+        connection_mock.post.side_effect = post
+        data_object = DataObject(connection_mock)
+        data_object.enable_validation_cache()
+        self.assertEqual(data_object.validate({"name": "Test"}, "Test"), expected)
+        self.assertIsNone(data_object._validation_cache)
+
+    def test_set_vector_precision(self):
+        """
+        Test the `set_vector_precision` method.
+        """
+
+        with self.assertRaises(TypeError) as error:
+            DataObject(Mock()).set_vector_precision(2.0)
+        check_error_message(self, error, "'decimals' must be of type <class 'int'>.")
+
+        connection_mock = mock_connection_func("post", return_json={"id": 0})
+        sent_vector = lambda: connection_mock.post.call_args[1]["weaviate_object"]["vector"]
+        data_object = DataObject(connection_mock)
+        data_object.create({}, "Test", vector=[0.123456, 1.0])
+        self.assertEqual(sent_vector(), [0.123456, 1.0])
+
+        data_object.set_vector_precision(2)
+        data_object.create({}, "Test", vector=[0.123456, 1.0])
+        self.assertEqual(sent_vector(), [0.12, 1.0])
+
+        data_object.set_vector_precision(None)
+        data_object.create({}, "Test", vector=[0.123456, 1.0])
+        self.assertEqual(sent_vector(), [0.123456, 1.0])
+
+    def test_read_cache(self):
+        """
+        Test the `enable_read_cache` and `disable_read_cache` methods.
+        """
+
+        uuid = "1d420c9c-98cb-11ec-9db6-1e008a366d49"
+        other_uuid = "1d420c9c-98cb-11ec-9db6-1e008a366d50"
+
+        with self.assertRaises(TypeError) as error:
+            DataObject(Mock()).enable_read_cache(maxsize=1.5)
+        check_error_message(self, error, "'maxsize' must be of type <class 'int'>.")
+        with self.assertRaises(ValueError) as error:
+            DataObject(Mock()).enable_read_cache(ttl=0)
+        check_error_message(self, error, "'ttl' must be positive, i.e. greater that zero (>0).")
+
+        connection_mock = mock_connection_func("get", return_json={"id": uuid})
+        mock_connection_func("head", status_code=204, connection_mock=connection_mock)
+        mock_connection_func("delete", status_code=204, connection_mock=connection_mock)
+        data_object = DataObject(connection_mock)
+
+        # reads are not cached by default
+        data_object.get_by_id(uuid)
+        data_object.get_by_id(uuid)
+        self.assertEqual(connection_mock.get.call_count, 2)
+
+        data_object.enable_read_cache()
+        result = data_object.get_by_id(uuid)
+        self.assertEqual(result, {"id": uuid})
+        result["id"] = "changed"  # changing a result must not change the cached object
+        self.assertEqual(data_object.get_by_id(uuid), {"id": uuid})
+        self.assertEqual(connection_mock.get.call_count, 3)
+        # different arguments are cached separately
+        data_object.get_by_id(uuid, with_vector=True)
+        data_object.get_by_id(other_uuid)
+        self.assertEqual(connection_mock.get.call_count, 5)
+
+        self.assertTrue(data_object.exists(uuid))
+        self.assertTrue(data_object.exists(uuid))
+        self.assertEqual(connection_mock.head.call_count, 1)
+
+        # deleting an object invalidates only its cached reads
+        data_object.delete(uuid)
+        data_object.get_by_id(uuid)
+        data_object.get_by_id(other_uuid)
+        self.assertEqual(connection_mock.get.call_count, 6)
+        self.assertTrue(data_object.exists(uuid))
+        self.assertEqual(connection_mock.head.call_count, 2)
+
+        # creating objects with the batch endpoint replaces existing objects
+        mock_connection_func("post", return_json=[{"id": uuid}], connection_mock=connection_mock)
+        data_object.create_many([{"data_object": {}, "class_name": "Test", "uuid": uuid}])
+        data_object.get_by_id(uuid)
+        data_object.get_by_id(other_uuid)
+        self.assertEqual(connection_mock.get.call_count, 7)
+
+        # objects that are not found are not cached
+        connection_mock = mock_connection_func("get", status_code=404)
+        mock_connection_func("head", status_code=404, connection_mock=connection_mock)
+        data_object = DataObject(connection_mock)
+        data_object.enable_read_cache()
+        self.assertIsNone(data_object.get_by_id(uuid))
+        self.assertIsNone(data_object.get_by_id(uuid))
+        self.assertFalse(data_object.exists(uuid))
+        self.assertFalse(data_object.exists(uuid))
+        self.assertEqual(connection_mock.get.call_count, 2)
+        self.assertEqual(connection_mock.head.call_count, 2)
+
+        data_object.disable_read_cache()
+        self.assertIsNone(data_object._read_cache)
+
+        # a read that was in flight while the object was invalidated is not cached
+        def get_while_deleted(path, params):
+            data_object.delete(uuid)
+            return mock_connection_func("get", return_json={"id": uuid}).get()
+
+        connection_mock = mock_connection_func("delete", status_code=204)
+        connection_mock.get.side_effect = get_while_deleted
+        data_object = DataObject(connection_mock)
+        data_object.enable_read_cache()
+        self.assertEqual(data_object.get_by_id(uuid), {"id": uuid})
+        self.assertEqual(len(data_object._read_cache), 0)
+        connection_mock.get.side_effect = None
+        connection_mock.get.return_value = mock_connection_func(
+            "get", return_json={"id": uuid}
+        ).get()
+        data_object.get_by_id(uuid)
+        self.assertEqual(len(data_object._read_cache), 1)
+
+        # concurrent reads of an object that is not cached share one request
+        release = Event()
+
+        def blocking_get(path, params):
+            release.wait(5)
+            return mock_connection_func("get", return_json={"id": uuid}).get()
+
+        connection_mock = mock_connection_func()
+        connection_mock.get.side_effect = blocking_get
+        data_object = DataObject(connection_mock)
+        data_object.enable_read_cache()
+        futures = call_concurrently(lambda: data_object.get_by_id(uuid), 3, release)
+        results = [future.result() for future in futures]
+        self.assertEqual(results, [{"id": uuid}] * 3)
+        self.assertIsNot(results[0], results[1])
+        self.assertEqual(connection_mock.get.call_count, 1)
+
+        # a read after a change of the object does not share the request sent before the change
+        release.clear()
+        results = iter([{"id": uuid, "name": "old"}, {"id": uuid, "name": "new"}])
+
+        def get_before_change(path, params):
+            result = next(results)
+            if result["name"] == "old":
+                release.wait(5)
+            return mock_connection_func("get", return_json=result).get()
+
+        connection_mock = mock_connection_func("delete", status_code=204)
+        connection_mock.get.side_effect = get_before_change
+        data_object = DataObject(connection_mock)
+        data_object.enable_read_cache()
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(data_object.get_by_id, uuid)
+            wait_until(lambda: connection_mock.get.called)
+            data_object.delete(uuid)
+            self.assertEqual(data_object.get_by_id(uuid), {"id": uuid, "name": "new"})
+            release.set()
+            self.assertEqual(future.result(), {"id": uuid, "name": "old"})
+
     @patch("weaviate.data.crud_data._get_dict_from_object", side_effect=lambda x: x)
-    @patch("weaviate.data.crud_data.get_vector", side_effect=lambda x: x)
+    @patch("weaviate.data.crud_data._get_vector_payload", side_effect=lambda x: x)
     def test_validate(self, mock_get_vector, mock_get_dict_from_object):
         """
         Test the `validate` method.
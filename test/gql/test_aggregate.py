@@ -1,8 +1,15 @@
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier, Event
 
 from requests.exceptions import ConnectionError as RequestsConnectionError
 
-from test.util import mock_connection_func, check_error_message, check_startswith_error_message
+from test.util import (
+    call_concurrently,
+    mock_connection_func,
+    check_error_message,
+    check_startswith_error_message,
+)
 from weaviate.exceptions import UnexpectedStatusCodeException
 from weaviate.gql.aggregate import AggregateBuilder
 
@@ -94,6 +101,39 @@ class TestAggregateBuilder(unittest.TestCase):
             path="/graphql", weaviate_object={"query": expected_gql_clause}
         )
 
+        # concurrent identical queries send their own request by default
+        queries = []
+        all_sent = Barrier(3)
+
+        def post(path, weaviate_object):
+            queries.append(weaviate_object["query"])
+            all_sent.wait(5)
+            return mock_connection_func("post", return_json={"status": "OK!"}).post()
+
+        mock_obj.post.side_effect = post
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [executor.submit(self.aggregate.do) for _ in range(3)]
+            results = [future.result() for future in futures]
+        self.assertEqual(results, [{"status": "OK!"}] * 3)
+        self.assertEqual(queries, [expected_gql_clause] * 3)
+
+        # concurrent identical queries share one request if enabled
+        self.assertIs(self.aggregate.with_request_coalescing(), self.aggregate)
+        release = Event()
+
+        def blocking_post(path, weaviate_object):
+            release.wait(5)
+            return mock_connection_func("post", return_json={"status": "OK!"}).post()
+
+        mock_obj.post.reset_mock()
+        mock_obj.post.side_effect = blocking_post
+        futures = call_concurrently(self.aggregate.do, 3, release)
+        results = [future.result() for future in futures]
+        self.assertEqual(results, [{"status": "OK!"}] * 3)
+        mock_obj.post.assert_called_once_with(
+            path="/graphql", weaviate_object={"query": expected_gql_clause}
+        )
+
     def test_uncapitalized_class_name(self):
         """
         Test the uncapitalized class_name.
@@ -1,5 +1,10 @@
 import unittest
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 from test.util import check_error_message, check_startswith_error_message
 from weaviate.gql.filter import NearText, NearVector, NearObject, NearImage, Where, Ask
 
@@ -373,6 +378,15 @@ class TestNearVector(unittest.TestCase):
             str(near_vector), "nearVector: {vector: [1.0, 2.0, 3.0, 4.0] certainty: 0.75} "
         )
 
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test___str___numpy(self):
+        """
+        Test the `__str__` method with a `numpy.ndarray` vector.
+        """
+
+        near_vector = NearVector({"vector": np.array([1.0, 2.0, 3.0, 4.0])})
+        self.assertEqual(str(near_vector), "nearVector: {vector: [1.0, 2.0, 3.0, 4.0]} ")
+
 
 class TestNearObject(unittest.TestCase):
     def test___init__(self):
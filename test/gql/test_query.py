@@ -64,3 +64,50 @@ class TestQuery(unittest.TestCase):
         with self.assertRaises(UnexpectedStatusCodeException) as error:
             query.raw("TestQuery")
         check_startswith_error_message(self, error, query_error_message)
+
+    def test_raw_many(self):
+        """
+        Test the `raw_many` method.
+        """
+
+        # valid calls
+        connection_mock = mock_connection_func(
+            "post", return_json=[{"data": {"Get": {}}}, {"data": {"Aggregate": {}}}]
+        )
+        query = Query(connection_mock)
+
+        self.assertEqual(query.raw_many([]), [])
+        connection_mock.post.assert_not_called()
+
+        gql_queries = ["{Get {Group {name}}}", "{Aggregate {Group {meta {count}}}}"]
+        self.assertEqual(
+            query.raw_many(gql_queries), [{"data": {"Get": {}}}, {"data": {"Aggregate": {}}}]
+        )
+        connection_mock.post.assert_called_once_with(
+            path="/graphql/batch",
+            weaviate_object=[{"query": gql_queries[0]}, {"query": gql_queries[1]}],
+        )
+
+        # invalid calls
+
+        type_error_message = "Queries are expected to be a list of strings"
+        requests_error_message = "Queries not executed."
+        query_error_message = "GQL queries failed"
+
+        with self.assertRaises(TypeError) as error:
+            query.raw_many("TestQuery")
+        check_error_message(self, error, type_error_message)
+
+        with self.assertRaises(TypeError) as error:
+            query.raw_many(["TestQuery", 1])
+        check_error_message(self, error, type_error_message)
+
+        query = Query(mock_connection_func("post", side_effect=RequestsConnectionError("Test!")))
+        with self.assertRaises(RequestsConnectionError) as error:
+            query.raw_many(["TestQuery"])
+        check_error_message(self, error, requests_error_message)
+
+        query = Query(mock_connection_func("post", status_code=404))
+        with self.assertRaises(UnexpectedStatusCodeException) as error:
+            query.raw_many(["TestQuery"])
+        check_startswith_error_message(self, error, query_error_message)
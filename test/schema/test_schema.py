@@ -5,7 +5,12 @@ from unittest.mock import patch, Mock
 
 from requests.exceptions import ConnectionError as RequestsConnectionError
 
-from test.util import mock_connection_func, check_error_message, check_startswith_error_message
+from test.util import (
+    concurrent_call_count,
+    mock_connection_func,
+    check_error_message,
+    check_startswith_error_message,
+)
 from weaviate.exceptions import UnexpectedStatusCodeException
 from weaviate.schema import Schema
 from weaviate.util import _capitalize_first_letter
@@ -146,8 +151,19 @@ class TestSchema(unittest.TestCase):
 
         schema.create("test/schema/schema_company.json")  # with read from file
 
-        mock_primitive.assert_called_with(schema_company_local["classes"])
-        mock_complex.assert_called_with(schema_company_local["classes"])
+        mock_primitive.assert_called_with(schema_company_local["classes"], 1)
+        mock_complex.assert_called_with(schema_company_local["classes"], 1)
+
+        schema.create("test/schema/schema_company.json", concurrency=4)
+
+        mock_primitive.assert_called_with(schema_company_local["classes"], 4)
+        mock_complex.assert_called_with(schema_company_local["classes"], 4)
+
+        with self.assertRaises(ValueError) as error:
+            schema.create("test/schema/schema_company.json", concurrency=0)
+        check_error_message(
+            self, error, "'concurrency' must be positive, i.e. greater that zero (>0)."
+        )
 
     def test_create_class(self):
         """
@@ -374,6 +390,68 @@ class TestSchema(unittest.TestCase):
         self.assertEqual(mock_connection.get.call_count, 1)
         self.assertEqual(mock_connection.delete.call_count, 2)
 
+        # the other classes are deleted even if deleting one of them fails
+        two_classes_schema = {"classes": [{"class": "Company"}, {"class": "Person"}]}
+        mock_connection = mock_connection_func("get", return_json=two_classes_schema)
+        mock_connection.delete.side_effect = lambda path: Mock(
+            status_code=404 if path == "/schema/Company" else 200, content=b"null"
+        )
+        schema = Schema(mock_connection)
+
+        with self.assertRaises(UnexpectedStatusCodeException) as error:
+            schema.delete_all(concurrency=2)
+        check_startswith_error_message(self, error, "Delete class from schema")
+        self.assertEqual(
+            sorted(call[1]["path"] for call in mock_connection.delete.call_args_list),
+            ["/schema/Company", "/schema/Person"],
+        )
+
+    def test_update_class_shard(self):
+        """
+        Test the `update_class_shard` method.
+        """
+
+        shards = [{"name": f"shard{i}", "status": "READY"} for i in range(3)]
+        mock_connection = mock_connection_func("get", return_json=shards)
+        mock_connection = mock_connection_func(
+            "put", return_json={"status": "READONLY"}, connection_mock=mock_connection
+        )
+        schema = Schema(mock_connection)
+
+        # a single shard
+        self.assertEqual(
+            schema.update_class_shard("article", "READONLY", "shard1"), {"status": "READONLY"}
+        )
+        mock_connection.put.assert_called_once_with(
+            path="/schema/Article/shards/shard1", weaviate_object={"status": "READONLY"}
+        )
+        mock_connection.get.assert_not_called()
+
+        # all the shards of the class, updated concurrently
+        mock_connection.put.reset_mock()
+        self.assertEqual(
+            schema.update_class_shard("article", "READONLY", concurrency=2),
+            [{"status": "READONLY"}] * 3,
+        )
+        mock_connection.get.assert_called_once_with(path="/schema/Article/shards")
+        self.assertEqual(concurrent_call_count(mock_connection.put), 3)
+        for i in range(3):
+            mock_connection.put.assert_any_call(
+                path=f"/schema/Article/shards/shard{i}", weaviate_object={"status": "READONLY"}
+            )
+
+        # stream the updated shards
+        self.assertEqual(
+            sorted(schema.update_class_shard("article", "READONLY", stream=True)),
+            [(f"shard{i}", {"status": "READONLY"}) for i in range(3)],
+        )
+
+        mock_connection = mock_connection_func("put", status_code=404)
+        schema = Schema(mock_connection)
+        with self.assertRaises(UnexpectedStatusCodeException) as error:
+            schema.update_class_shard("Article", "READONLY", "shard1")
+        check_startswith_error_message(self, error, "Update shard 'shard1' status")
+
     def test__create_complex_properties_from_classes(self):
         """
         Test the `_create_complex_properties_from_classes` method.
@@ -387,6 +465,9 @@ class TestSchema(unittest.TestCase):
         schema._create_complex_properties_from_classes(list("Test!"))
         self.assertEqual(mock_complex.call_count, 5)
 
+        schema._create_complex_properties_from_classes(list("Test!"), concurrency=2)
+        self.assertEqual(concurrent_call_count(mock_complex), 10)
+
     def test__create_complex_properties_from_class(self):
         """
         Test the `_create_complex_properties_from_class` method.
@@ -581,6 +662,9 @@ class TestSchema(unittest.TestCase):
         schema._create_classes_with_primitives(list("Test!!"))
         self.assertEqual(mock_primitive.call_count, 6)
 
+        schema._create_classes_with_primitives(list("Test!!"), concurrency=3)
+        self.assertEqual(concurrent_call_count(mock_primitive), 12)
+
     def test__property_is_primitive(self):
         """
         Test the `_property_is_primitive` function.
@@ -148,25 +148,17 @@ class TestWeaviateClient(unittest.TestCase):
         Test the `get_meta` method.
         """
 
-        # client = Client("http://localhost:8080")
-        # # Request to weaviate returns 200
-        # connection_mock = mock_connection_func('get', return_json="OK!")
-        # client._connection = connection_mock
-        # self.assertEqual(client.get_meta(), "OK!")
-        # connection_mock.get.assert_called_with(
-        #     path="/meta"
-        # )
-
-        # # Request to weaviate returns 404
-        # connection_mock = mock_connection_func('get', status_code=404)
-        # client._connection = connection_mock
-        # with self.assertRaises(UnexpectedStatusCodeException) as error:
-        #     client.get_meta()
-        # error_message = "Meta endpoint! Unexpected status code: 404, with response body: None"
-        # check_error_message(self, error, error_message)
-        # connection_mock.get.assert_called_with(
-        #     path="/meta"
-        # )
+        client = Client("http://localhost:8080")
+        connection_mock = Mock()
+        connection_mock.get_meta.return_value = {"version": "1.17.0", "modules": {}}
+        client._connection = connection_mock
+        meta = client.get_meta()
+        self.assertEqual(meta, {"version": "1.17.0", "modules": {}})
+        connection_mock.get_meta.assert_called_once()
+
+        # the cached meta of the connection cannot be changed through the returned dict
+        meta["modules"]["test"] = True
+        self.assertEqual(client.get_meta(), {"version": "1.17.0", "modules": {}})
 
     @patch("weaviate.client.Client.get_meta", return_value={"version": "1.13.2"})
     def test_get_open_id_configuration(self, mock_get_meta):
@@ -206,3 +198,17 @@ class TestWeaviateClient(unittest.TestCase):
         self.assertEqual(client.timeout_config, (1, 2))
         client.timeout_config = (4, 20)  # ;)
         self.assertEqual(client.timeout_config, (4, 20))
+
+    @patch("weaviate.client.Client.get_meta", return_value={"version": "1.13.2"})
+    def test_close(self, mock_get_meta):
+        """
+        Test the `close` method and the context manager.
+        """
+
+        client = Client("http://some_url.com")
+        client.close()
+        client._connection.close.assert_called_once_with()
+
+        with Client("http://some_url.com") as client:
+            client._connection.close.assert_not_called()
+        client._connection.close.assert_called_once_with()
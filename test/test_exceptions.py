@@ -26,6 +26,8 @@ class TestExceptions(unittest.TestCase):
             str(exception), "Test message! Unexpected status code: 1234, with response body: None."
         )
         self.assertEqual(exception.status_code, response.status_code)
+        self.assertIsNone(exception.json)
+        response.json.assert_called_once()
 
         # with .json() value
         response = Mock()
@@ -38,6 +40,8 @@ class TestExceptions(unittest.TestCase):
             "Second test message! Unexpected status code: 4321, with response body: {'test': 'OK!'}.",
         )
         self.assertEqual(exception.status_code, response.status_code)
+        self.assertEqual(exception.json, {"test": "OK!"})
+        response.json.assert_called_once()
 
     def test_object_already_exists(self):
         """
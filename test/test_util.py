@@ -1,9 +1,22 @@
 import unittest
 import uuid as uuid_lib
 from copy import deepcopy
+from threading import Event
 from unittest.mock import patch, Mock
 
-from test.util import check_error_message
+import requests
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from test.util import call_concurrently, check_error_message
 from weaviate import SchemaValidationException
 from weaviate.util import (
     generate_uuid5,
@@ -15,8 +28,16 @@ from weaviate.util import (
     get_vector,
     get_valid_uuid,
     get_domain_from_weaviate_url,
+    _decode_json,
     _get_dict_from_object,
+    _get_vector_payload,
+    _get_valid_uuid_from_str,
     _is_sub_schema,
+    _LRUCache,
+    _json_serialize,
+    _map_concurrently,
+    _round_vector,
+    _SingleFlight,
 )
 
 schema_set = {
@@ -300,6 +321,22 @@ class TestUtil(unittest.TestCase):
         result = get_valid_uuid(uuid_lib.UUID("1c9cd58488fe501083d0017cb3fcb446"))
         self.assertEqual(result, "1c9cd584-88fe-5010-83d0-017cb3fcb446")
 
+        ## repeated validations are served from the cache
+        hits = _get_valid_uuid_from_str.cache_info().hits
+        result = get_valid_uuid("1c9cd58488fe501083d0017cb3fcb446")
+        self.assertEqual(result, "1c9cd584-88fe-5010-83d0-017cb3fcb446")
+        self.assertEqual(_get_valid_uuid_from_str.cache_info().hits, hits + 1)
+
+        ## canonical UUIDs are returned without parsing any URL
+        _get_valid_uuid_from_str.cache_clear()
+        with patch("weaviate.util.is_weaviate_object_url") as mock_is_weaviate_object_url:
+            result = get_valid_uuid("1c9cd584-88fe-5010-83d0-017cb3fcb446")
+            self.assertEqual(result, "1c9cd584-88fe-5010-83d0-017cb3fcb446")
+            mock_is_weaviate_object_url.assert_not_called()
+            result = get_valid_uuid("1C9CD584-88FE-5010-83D0-017CB3FCB446")
+            self.assertEqual(result, "1c9cd584-88fe-5010-83d0-017cb3fcb446")
+            mock_is_weaviate_object_url.assert_called()
+
         # invalid formats
         type_error_message = "'uuid' must be of type str or uuid.UUID, but was: "
         value_error_message = "Not valid 'uuid' or 'uuid' can not be extracted from value"
@@ -366,6 +403,115 @@ class TestUtil(unittest.TestCase):
             get_vector("[1., 2., 3.]")
         check_error_message(self, error, type_error_message)
 
+    @unittest.skipIf(np is None, "numpy is not installed")
+    @patch("weaviate.util.orjson", Mock())
+    def test__get_vector_payload(self):
+        """
+        Test the `_get_vector_payload` function with `orjson` available, i.e. without copying to
+        a list.
+        """
+
+        # the public function always returns a list
+        self.assertEqual(get_vector(np.array([[1.0, 2.0, 3.0]])), [1.0, 2.0, 3.0])
+        self.assertEqual(_get_vector_payload([1.0, 2.0]), [1.0, 2.0])
+
+        vector = np.array([[1.0, 2.0, 3.0]])
+        result = _get_vector_payload(vector)
+        self.assertIsInstance(result, np.ndarray)
+        self.assertEqual(result.shape, (3,))
+        # the squeezed array is a view on the original
+        self.assertTrue(np.shares_memory(result, vector))
+
+        # tensors that cannot be converted to an array (e.g. bfloat16) are converted to a list
+        class Tensor:
+            def detach(self):
+                return self
+
+            def cpu(self):
+                return self
+
+            def numpy(self):
+                raise TypeError("Got unsupported ScalarType BFloat16")
+
+            def squeeze(self):
+                return Mock(tolist=Mock(return_value=[1.0, 2.0, 3.0]))
+
+        with patch.dict("sys.modules", {"torch": Mock(Tensor=Tensor)}):
+            self.assertEqual(_get_vector_payload(Tensor()), [1.0, 2.0, 3.0])
+
+        # without `orjson` the payload is a list
+        with patch("weaviate.util.orjson", None):
+            self.assertEqual(_get_vector_payload(vector), [1.0, 2.0, 3.0])
+
+    def test__round_vector(self):
+        """
+        Test the `_round_vector` function.
+        """
+
+        self.assertEqual(_round_vector([0.123456, 1.0, -2.98765], 3), [0.123, 1.0, -2.988])
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test__round_vector_numpy(self):
+        """
+        Test the `_round_vector` function with a `numpy.ndarray`.
+        """
+
+        result = _round_vector(np.array([0.123456, 1.0, -2.98765], dtype=np.float32), 3)
+        self.assertIsInstance(result, np.ndarray)
+        self.assertEqual(result.dtype, np.float32)
+        self.assertTrue(np.allclose(result, [0.123, 1.0, -2.988], rtol=0, atol=1e-6))
+
+    def test__json_serialize(self):
+        """
+        Test the `_json_serialize` function.
+        """
+
+        self.assertIsNone(_json_serialize(None))
+        self.assertEqual(
+            _json_serialize({"a": [1, 2.5], "b": "ü"}), '{"a":[1,2.5],"b":"ü"}'.encode()
+        )
+        with patch("weaviate.util.orjson", None):
+            self.assertEqual(
+                _json_serialize({"a": [1, 2.5], "b": "ü"}), '{"a":[1,2.5],"b":"ü"}'.encode()
+            )
+
+        # objects that provide `tolist`, e.g. non-contiguous numpy arrays or numpy scalars
+        tolist_mock = Mock()
+        tolist_mock.tolist.return_value = [1.0, 2.0]
+        self.assertEqual(_json_serialize({"vector": tolist_mock}), b'{"vector":[1.0,2.0]}')
+
+        with self.assertRaises(TypeError):
+            _json_serialize({"a": object()})
+
+        # the result does not depend on whether `orjson` is installed
+        for orjson_module in (orjson, None):
+            with patch("weaviate.util.orjson", orjson_module):
+                self.assertEqual(_json_serialize({1: None, "b": "null"}), b'{"1":null,"b":"null"}')
+                for number in (float("nan"), float("inf"), -float("inf")):
+                    with self.assertRaises(ValueError):
+                        _json_serialize({"vector": [1.0, number]})
+                if np is not None:
+                    with self.assertRaises(ValueError):
+                        _json_serialize({"vector": np.array([1.0, np.nan])})
+
+    def test__decode_json(self):
+        """
+        Test the `_decode_json` function.
+        """
+
+        response = requests.Response()
+        response._content = '{"a":[1,2.5],"b":"ü"}'.encode()
+        self.assertEqual(_decode_json(response), {"a": [1, 2.5], "b": "ü"})
+        with patch("weaviate.util.orjson", None):
+            self.assertEqual(_decode_json(response), {"a": [1, 2.5], "b": "ü"})
+
+        response._content = b"<html></html>"
+        with self.assertRaises(requests.exceptions.JSONDecodeError):
+            _decode_json(response)
+        with patch("weaviate.util.orjson", None):
+            with self.assertRaises(requests.exceptions.JSONDecodeError):
+                _decode_json(response)
+
     def test_get_domain_from_weaviate_url(self):
         """
         Test the `get_domain_from_weaviate_url` function.
@@ -459,3 +605,87 @@ class TestUtil(unittest.TestCase):
         result = generate_uuid5("TestID!", "Test!")
         self.assertIsInstance(result, str)
         mock_uuid.uuid5.assert_called()
+
+    @patch("weaviate.util.time.monotonic", return_value=0.0)
+    def test__lru_cache(self, mock_monotonic):
+        """
+        Test the `_LRUCache` class.
+        """
+
+        cache = _LRUCache(maxsize=2)
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.get("a", "default"), "default")
+
+        cache.put("a", 1)
+        cache.put("b", 2)
+        self.assertEqual(cache.get("a"), 1)  # 'b' is the least recently used now
+        cache.put("c", 3)
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), 1)
+        self.assertEqual(cache.get("c"), 3)
+
+        cache.invalidate("a")
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.get("c"), 3)
+        cache.invalidate("not cached")
+        cache.put(("b", 1), 2)
+        cache.invalidate_if(lambda key: key[0] == "b")
+        self.assertIsNone(cache.get(("b", 1)))
+        self.assertEqual(cache.get("c"), 3)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+        # entries expire after 'ttl' seconds
+        cache = _LRUCache(maxsize=2, ttl=10)
+        cache.put("a", 1)
+        mock_monotonic.return_value = 9.9
+        self.assertEqual(cache.get("a"), 1)
+        mock_monotonic.return_value = 10.0
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(len(cache), 0)
+
+    def test__single_flight(self):
+        """
+        Test the `_SingleFlight` class.
+        """
+
+        single_flight = _SingleFlight()
+        self.assertEqual(single_flight.do("a", lambda: 1), 1)
+        self.assertEqual(single_flight.do("a", lambda: 2), 2)  # finished calls are not reused
+        self.assertEqual(len(single_flight), 0)
+
+        # concurrent calls for the same key share one call and its result
+        release = Event()
+        func = Mock(side_effect=lambda: release.wait(5) and {"result": 1})
+        futures = call_concurrently(lambda: single_flight.do("a", func), 3, release)
+        results = [future.result() for future in futures]
+        self.assertEqual(func.call_count, 1)
+        self.assertEqual(results, [{"result": 1}] * 3)
+        self.assertIs(results[0], results[1])
+        self.assertEqual(len(single_flight), 0)
+
+        # exceptions are raised for all the waiting calls
+        release.clear()
+        func = Mock(side_effect=lambda: release.wait(5) and 1 / 0)
+        futures = call_concurrently(lambda: single_flight.do("a", func), 2, release)
+        for future in futures:
+            with self.assertRaises(ZeroDivisionError):
+                future.result()
+        self.assertEqual(func.call_count, 1)
+        self.assertEqual(len(single_flight), 0)
+
+    def test__map_concurrently(self):
+        """
+        Test the `_map_concurrently` function.
+        """
+
+        self.assertEqual(_map_concurrently(lambda x: 2 * x, [1, 2, 3], concurrency=2), [2, 4, 6])
+
+        # a concurrency of 1 calls the function in order without a pool, and stops at an error
+        func = Mock(side_effect=[1, ZeroDivisionError(), 3])
+        with patch("weaviate.util.ThreadPoolExecutor") as mock_executor:
+            with self.assertRaises(ZeroDivisionError):
+                _map_concurrently(func, ["a", "b", "c"], concurrency=1)
+        mock_executor.assert_not_called()
+        self.assertEqual(func.call_args_list, [(("a",),), (("b",),)])
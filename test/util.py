@@ -1,5 +1,9 @@
-from typing import Union, Callable, Optional
-from unittest.mock import Mock
+import json
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Event, Semaphore
+from typing import Union, Callable, Optional, List
+from unittest.mock import Mock, patch
 
 
 def mock_connection_func(
@@ -69,6 +73,8 @@ def mock_connection_func(
             rest_method_return_mock = Mock()
             # mock the json() method and set its return value
             rest_method_return_mock.json.return_value = return_json
+            # the raw body, for code that decodes the JSON itself
+            rest_method_return_mock.content = json.dumps(return_json).encode("utf-8")
             # Set status code
             rest_method_return_mock.configure_mock(status_code=status_code)
             # set the return value of the given REST method
@@ -111,3 +117,96 @@ def check_startswith_error_message(self, error, message):
     """
 
     self.assertTrue(str(error.exception).startswith(message))
+
+
+def wait_until(condition: Callable[[], bool], timeout: float = 5.0) -> None:
+    """
+    Wait until `condition` is met.
+
+    Parameters
+    ----------
+    condition : Callable[[], bool]
+        The condition to wait for, polled every millisecond.
+    timeout : float, optional
+        The maximum number of seconds to wait, by default 5.0.
+
+    Raises
+    ------
+    AssertionError
+        If the condition is not met within `timeout` seconds.
+    """
+
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError(f"Condition not met within {timeout} seconds.")
+        time.sleep(0.001)
+
+
+def call_concurrently(func: Callable[[], object], count: int, release: Event) -> List[Future]:
+    """
+    Call `func` from `count` threads at the same time. The first call must run inside a
+    `weaviate.util._SingleFlight` and block until `release` is set, which happens once all the
+    other calls wait for its result.
+
+    Parameters
+    ----------
+    func : Callable[[], object]
+        The function to call.
+    count : int
+        The number of concurrent calls.
+    release : threading.Event
+        The event the first call blocks on.
+
+    Returns
+    -------
+    List[Future]
+        The finished calls.
+
+    Raises
+    ------
+    AssertionError
+        If the other calls do not wait for the first one within 5 seconds.
+    """
+
+    joined = Semaphore(0)
+
+    class JoinedFuture(Future):
+        """
+        The future of a running `_SingleFlight` call, that counts the calls waiting for it.
+        """
+
+        def result(self, timeout=None):
+            joined.release()
+            return super().result(timeout)
+
+    with patch("weaviate.util.Future", JoinedFuture):
+        with ThreadPoolExecutor(max_workers=count) as executor:
+            futures = [executor.submit(func) for _ in range(count)]
+            try:
+                for _ in range(count - 1):
+                    if not joined.acquire(timeout=5):
+                        raise AssertionError("The concurrent calls did not join the first one.")
+            finally:
+                release.set()
+    return futures
+
+
+def concurrent_call_count(mock: Mock) -> int:
+    """
+    Get the number of calls of a mock that was called from several threads at the same time.
+    `Mock.call_count` is not incremented atomically and can miss concurrent calls, while every
+    call is appended to `Mock.call_args_list`.
+
+    Parameters
+    ----------
+    mock : unittest.mock.Mock
+        The mock.
+
+    Returns
+    -------
+    int
+        The number of calls.
+    """
+
+    return len(mock.call_args_list)
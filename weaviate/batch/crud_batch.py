@@ -212,6 +212,7 @@ class Batch:
         self._connection_error_retries = 3
         self._batching_type = None
         self._num_workers = 1
+        self._compression = False
 
         # thread pool executor
         self._executor: Optional[BatchExecutor] = None
@@ -225,6 +226,7 @@ class Batch:
         callback: Optional[Callable[[dict], None]] = check_batch_result,
         dynamic: bool = False,
         num_workers: int = 1,
+        compression: bool = False,
     ) -> "Batch":
         """
         Configure the instance to your needs. (`__call__` and `configure` methods are the same).
@@ -255,6 +257,10 @@ class Batch:
             The maximal number of concurrent threads to run batch import. Only used for non-MANUAL
             batching. i.e. is used only with AUTO or DYNAMIC batching.
             By default, the multi-threading is disabled. Use with care to not overload your weaviate instance.
+        compression : bool, optional
+            Whether to gzip the batch request bodies that are larger than 64KiB. Only enable it if
+            your weaviate instance (or a proxy in front of it) accepts gzip encoded request bodies,
+            by default False.
 
         Returns
         -------
@@ -277,6 +283,7 @@ class Batch:
             callback=callback,
             dynamic=dynamic,
             num_workers=num_workers,
+            compression=compression,
         )
 
     def __call__(
@@ -288,6 +295,7 @@ class Batch:
         callback: Optional[Callable[[dict], None]] = check_batch_result,
         dynamic: bool = False,
         num_workers: int = 1,
+        compression: bool = False,
     ) -> "Batch":
         """
         Configure the instance to your needs. (`__call__` and `configure` methods are the same).
@@ -318,6 +326,10 @@ class Batch:
             The maximal number of concurrent threads to run batch import. Only used for non-MANUAL
             batching. i.e. is used only with AUTO or DYNAMIC batching.
             By default, the multi-threading is disabled. Use with care to not overload your weaviate instance.
+        compression : bool, optional
+            Whether to gzip the batch request bodies that are larger than 64KiB. Only enable it if
+            your weaviate instance (or a proxy in front of it) accepts gzip encoded request bodies,
+            by default False.
 
         Returns
         -------
@@ -339,8 +351,10 @@ class Batch:
 
         _check_non_negative(timeout_retries, "timeout_retries", int)
         _check_non_negative(connection_error_retries, "connection_error_retries", int)
+        _check_bool(compression, "compression")
 
         self._callback = callback
+        self._compression = compression
 
         self._timeout_retries = timeout_retries
         self._connection_error_retries = connection_error_retries
@@ -537,7 +551,9 @@ class Batch:
             while True:
                 try:
                     response = self._connection.post(
-                        path="/batch/" + data_type, weaviate_object=batch_request.get_request_body()
+                        path="/batch/" + data_type,
+                        weaviate_object=batch_request.get_request_body(),
+                        compress=self._compression,
                     )
                 except ReadTimeout as error:
                     batch_request = self._batch_readd_after_timeout(data_type, batch_request)
@@ -635,9 +651,13 @@ class Batch:
             )
 
             obj_weav = response.json()
-            if obj_weav["properties"] != obj["properties"] or obj.get(
+            vector = obj.get("vector", None)
+            if vector is not None and not isinstance(vector, list):
+                # numpy.ndarray, see `weaviate.util._get_vector_payload`
+                vector = vector.tolist()
+            if obj_weav["properties"] != obj["properties"] or vector != obj_weav.get(
                 "vector", None
-            ) != obj_weav.get("vector", None):
+            ):
                 new_batch.add(
                     class_name=_capitalize_first_letter(class_name),
                     data_object=obj["properties"],
@@ -763,15 +783,14 @@ class Batch:
         if len(self._objects_batch) != 0:
             _Warnings.manual_batching()
 
+            nr_objects = len(self._objects_batch)
             response = self._create_data(
                 data_type="objects",
                 batch_request=self._objects_batch,
             )
             self._objects_batch = ObjectsBatchRequest()
 
-            self._objects_throughput_frame.append(
-                len(self._objects_batch) / response.elapsed.total_seconds()
-            )
+            self._objects_throughput_frame.append(nr_objects / response.elapsed.total_seconds())
             obj_per_second = sum(self._objects_throughput_frame) / len(
                 self._objects_throughput_frame
             )
@@ -858,6 +877,7 @@ class Batch:
         if len(self._reference_batch) != 0:
             _Warnings.manual_batching()
 
+            nr_references = len(self._reference_batch)
             response = self._create_data(
                 data_type="references",
                 batch_request=self._reference_batch,
@@ -865,7 +885,7 @@ class Batch:
             self._reference_batch = ReferenceBatchRequest()
 
             self._references_throughput_frame.append(
-                len(self._reference_batch) / response.elapsed.total_seconds()
+                nr_references / response.elapsed.total_seconds()
             )
             ref_per_sec = sum(self._references_throughput_frame) / len(
                 self._references_throughput_frame
@@ -1026,20 +1046,37 @@ class Batch:
         creates both batch requests when only one is full.
         """
 
+        auto_create = self._AUTO_CREATE_BY_BATCHING_TYPE.get(self._batching_type)
+        if auto_create is None:
+            # just in case
+            raise ValueError(f'Unsupported batching type "{self._batching_type}"')
+        auto_create(self)
+
+    def _auto_create_fixed(self) -> None:
+        """
+        Auto create both objects and references when the sum of both equals batch_size.
+        """
+
         # greater or equal in case the self._batch_size is changed manually
-        if self._batching_type == "fixed":
-            if sum(self.shape) >= self._batch_size:
-                self._send_batch_requests(force_wait=False)
-            return
-        elif self._batching_type == "dynamic":
-            if (
-                self.num_objects() >= self._recommended_num_objects
-                or self.num_references() >= self._recommended_num_references
-            ):
-                self._send_batch_requests(force_wait=False)
-            return
-        # just in case
-        raise ValueError(f'Unsupported batching type "{self._batching_type}"')
+        if len(self._objects_batch) + len(self._reference_batch) >= self._batch_size:
+            self._send_batch_requests(force_wait=False)
+
+    def _auto_create_dynamic(self) -> None:
+        """
+        Auto create both objects and references when one of them reached its recommended number.
+        """
+
+        if (
+            len(self._objects_batch) >= self._recommended_num_objects
+            or len(self._reference_batch) >= self._recommended_num_references
+        ):
+            self._send_batch_requests(force_wait=False)
+
+    # resolve the auto-create check with one lookup instead of comparing the batching type
+    _AUTO_CREATE_BY_BATCHING_TYPE = {
+        "fixed": _auto_create_fixed,
+        "dynamic": _auto_create_dynamic,
+    }
 
     def flush(self) -> None:
         """
@@ -1525,6 +1562,35 @@ class Batch:
         _check_non_negative(value, "connection_error_retries", int)
         self._connection_error_retries = value
 
+    @property
+    def compression(self) -> bool:
+        """
+        Setter and Getter for `compression`.
+
+        Properties
+        ----------
+        value : bool
+            Setter ONLY: Whether to gzip the batch request bodies that are larger than 64KiB.
+
+        Returns
+        -------
+        bool
+            Getter ONLY: The `compression` value.
+
+        Raises
+        ------
+        TypeError
+            Setter ONLY: If the new value is not of type bool.
+        """
+
+        return self._compression
+
+    @compression.setter
+    def compression(self, value: bool) -> None:
+
+        _check_bool(value, "compression")
+        self._compression = value
+
 
 def _check_non_negative(value: Real, arg_name: str, data_type: type) -> None:
     """
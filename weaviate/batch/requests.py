@@ -6,7 +6,7 @@ from abc import ABC, abstractmethod
 from typing import List, Sequence, Optional
 from uuid import uuid4
 
-from weaviate.util import get_valid_uuid, get_vector
+from weaviate.util import get_valid_uuid, _get_vector_payload, _BEACON_PREFIX
 
 
 class BatchRequest(ABC):
@@ -130,18 +130,14 @@ class ReferenceBatchRequest(BatchRequest):
         from_object_uuid = get_valid_uuid(from_object_uuid)
 
         if to_object_class_name is not None:
-            to_beacon = f"weaviate://localhost/{to_object_class_name}/{to_object_uuid}"
+            to_beacon = f"{_BEACON_PREFIX}{to_object_class_name}/{to_object_uuid}"
         else:
-            to_beacon = f"weaviate://localhost/{to_object_uuid}"
+            to_beacon = _BEACON_PREFIX + to_object_uuid
 
         self._items.append(
             {
-                "from": "weaviate://localhost/"
-                + from_object_class_name
-                + "/"
-                + from_object_uuid
-                + "/"
-                + from_property_name,
+                "from": f"{_BEACON_PREFIX}{from_object_class_name}/{from_object_uuid}/"
+                f"{from_property_name}",
                 "to": to_beacon,
             }
         )
@@ -220,7 +216,7 @@ class ObjectsBatchRequest(BatchRequest):
             batch_item["id"] = get_valid_uuid(uuid4())
 
         if vector is not None:
-            batch_item["vector"] = get_vector(vector)
+            batch_item["vector"] = _get_vector_payload(vector)
 
         self._items.append(batch_item)
 
@@ -1,12 +1,14 @@
 """
 Classification class definition.
 """
+from typing import Optional
+
 from requests.exceptions import ConnectionError as RequestsConnectionError
 
 from weaviate.connect import Connection
 from weaviate.exceptions import UnexpectedStatusCodeException
-from weaviate.util import get_valid_uuid
-from .config_builder import ConfigBuilder
+from weaviate.util import get_valid_uuid, _decode_json
+from .config_builder import ConfigBuilder, _CLASSIFICATIONS_PATH
 
 
 class Classification:
@@ -64,18 +66,62 @@ class Classification:
             If weaviate reports a none OK status.
         """
 
-        classification_uuid = get_valid_uuid(classification_uuid)
+        return self._get_by_path(self._get_path(classification_uuid))
+
+    @staticmethod
+    def _get_path(classification_uuid: str) -> str:
+        """
+        Validate the classification UUID and build the path to its status.
+
+        Parameters
+        ----------
+        classification_uuid : str
+            Identifier of the classification.
+
+        Returns
+        -------
+        str
+            The path of the classification.
+
+        Raises
+        ------
+        ValueError
+            If not a proper uuid.
+        """
+
+        return _CLASSIFICATIONS_PATH + "/" + get_valid_uuid(classification_uuid)
+
+    def _get_by_path(self, path: str) -> dict:
+        """
+        Get the current state of the classification at an already validated path, so that
+        polling the same classification does not validate its UUID again.
+
+        Parameters
+        ----------
+        path : str
+            The path of the classification, see `_get_path`.
+
+        Returns
+        -------
+        dict
+            A dict containing the Weaviate answer.
+
+        Raises
+        ------
+        requests.ConnectionError
+            If the network connection to weaviate fails.
+        weaviate.UnexpectedStatusCodeException
+            If weaviate reports a none OK status.
+        """
 
         try:
-            response = self._connection.get(
-                path="/classifications/" + classification_uuid,
-            )
+            response = self._connection.get(path=path)
         except RequestsConnectionError as conn_err:
             raise RequestsConnectionError(
                 "Classification status could not be retrieved."
             ) from conn_err
         if response.status_code == 200:
-            return response.json()
+            return _decode_json(response)
         raise UnexpectedStatusCodeException("Get classification status", response)
 
     def is_complete(self, classification_uuid: str) -> bool:
@@ -93,7 +139,7 @@ class Classification:
             True if given classification has finished, False otherwise.
         """
 
-        return self._check_status(classification_uuid, "completed")
+        return self._get_status(classification_uuid) == "completed"
 
     def is_failed(self, classification_uuid: str) -> bool:
         """
@@ -110,7 +156,7 @@ class Classification:
             True if the classification failed, False otherwise.
         """
 
-        return self._check_status(classification_uuid, "failed")
+        return self._get_status(classification_uuid) == "failed"
 
     def is_running(self, classification_uuid: str) -> bool:
         """
@@ -127,29 +173,25 @@ class Classification:
             True if the classification is running, False otherwise.
         """
 
-        return self._check_status(classification_uuid, "running")
+        return self._get_status(classification_uuid) == "running"
 
-    def _check_status(self, classification_uuid: str, status: str) -> bool:
+    def _get_status(self, classification_uuid: str) -> Optional[str]:
         """
-        Check for a status of a classification.
+        Get the status of a classification.
 
         Parameters
         ----------
         classification_uuid : str
             Identifier of the classification.
-        status : str
-            Status to check for.
 
         Returns
         -------
-        bool
-            True if 'status' is satisfied, False otherwise.
+        Optional[str]
+            The status of the classification, None if it could not be retrieved.
         """
 
         try:
             response = self.get(classification_uuid)
         except RequestsConnectionError:
-            return False
-        if response["status"] == status:
-            return True
-        return False
+            return None
+        return response["status"]
@@ -1,14 +1,25 @@
 """
 ConfigBuilder class definition.
 """
+import random
 import time
+from numbers import Real
 from typing import Dict, Any
 
 from requests.exceptions import ConnectionError as RequestsConnectionError
 
 from weaviate.connect import Connection
 from weaviate.exceptions import UnexpectedStatusCodeException
-from weaviate.util import _capitalize_first_letter
+from weaviate.util import _capitalize_first_letter, _check_positive_num
+
+# polling intervals (in seconds) used while waiting for a classification to complete
+_INITIAL_POLL_INTERVAL = 0.3
+_MAX_POLL_INTERVAL = 30.0
+_POLL_BACKOFF_FACTOR = 1.5
+# random deviation of each polling interval, so concurrent waits do not poll in lockstep
+_POLL_JITTER = 0.25
+
+_CLASSIFICATIONS_PATH = "/classifications"
 
 
 class ConfigBuilder:
@@ -33,6 +44,8 @@ class ConfigBuilder:
         self._classification = classification
         self._config: Dict[str, Any] = {}
         self._wait_for_completion = False
+        self._max_poll_interval = _MAX_POLL_INTERVAL
+        self._poll_backoff_factor = _POLL_BACKOFF_FACTOR
 
     def with_type(self, classification_type: str) -> "ConfigBuilder":
         """
@@ -188,17 +201,49 @@ class ConfigBuilder:
         self._config["filters"]["targetWhere"] = where_filter
         return self
 
-    def with_wait_for_completion(self) -> "ConfigBuilder":
+    def with_wait_for_completion(
+        self,
+        max_poll_interval: Real = _MAX_POLL_INTERVAL,
+        poll_backoff_factor: Real = _POLL_BACKOFF_FACTOR,
+    ) -> "ConfigBuilder":
         """
-        Wait for completion.
+        Wait for completion. The classification status is checked right after the classification
+        was started, then again after 0.3 seconds, and the interval between two checks grows by
+        `poll_backoff_factor` up to `max_poll_interval`. Each interval is randomly shortened or
+        lengthened by up to 25%.
+
+        Parameters
+        ----------
+        max_poll_interval : Real, optional
+            The maximum number of seconds between two status checks, by default 30.0
+        poll_backoff_factor : Real, optional
+            The factor the interval between two status checks grows with, at least 1,
+            by default 1.5
 
         Returns
         -------
         ConfigBuilder
             Updated ConfigBuilder.
+
+        Raises
+        ------
+        TypeError
+            If argument is of wrong type.
+        ValueError
+            If 'max_poll_interval' is not positive or 'poll_backoff_factor' is smaller than 1.
         """
 
+        _check_positive_num(max_poll_interval, "max_poll_interval", Real)
+        _check_positive_num(poll_backoff_factor, "poll_backoff_factor", Real)
+        if poll_backoff_factor < 1:
+            raise ValueError(
+                "'poll_backoff_factor' must be greater than or equal to one (>=1), otherwise the "
+                "interval between two status checks shrinks."
+            )
+
         self._wait_for_completion = True
+        self._max_poll_interval = max_poll_interval
+        self._poll_backoff_factor = poll_backoff_factor
         return self
 
     def with_settings(self, settings: dict) -> "ConfigBuilder":
@@ -266,7 +311,9 @@ class ConfigBuilder:
         """
 
         try:
-            response = self._connection.post(path="/classifications", weaviate_object=self._config)
+            response = self._connection.post(
+                path=_CLASSIFICATIONS_PATH, weaviate_object=self._config
+            )
         except RequestsConnectionError as conn_err:
             raise RequestsConnectionError("Classification may not started.") from conn_err
         if response.status_code == 201:
@@ -290,8 +337,13 @@ class ConfigBuilder:
             return response
 
         # wait for completion
-        classification_uuid = response["id"]
-        # print(classification_uuid)
-        while self._classification.is_running(classification_uuid):
-            time.sleep(2.0)
-        return self._classification.get(classification_uuid)
+        # validate the uuid and build the path only once for all the polls
+        path = self._classification._get_path(response["id"])
+        poll_interval = min(_INITIAL_POLL_INTERVAL, self._max_poll_interval)
+        # the last polled classification already is the result once it stops running
+        classification = self._classification._get_by_path(path)
+        while classification["status"] == "running":
+            time.sleep(poll_interval * random.uniform(1 - _POLL_JITTER, 1 + _POLL_JITTER))
+            poll_interval = min(poll_interval * self._poll_backoff_factor, self._max_poll_interval)
+            classification = self._classification._get_by_path(path)
+        return classification
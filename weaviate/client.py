@@ -1,6 +1,7 @@
 """
 Client class definition.
 """
+import copy
 from numbers import Real
 from typing import Optional, Tuple, Union
 
@@ -11,13 +12,16 @@ from .backup import Backup
 from .batch import Batch
 from .classification import Classification
 from .cluster import Cluster
-from .connect.connection import Connection
+from .connect.connection import Connection, _OIDC_CONFIG_PATH
 from .contextionary import Contextionary
 from .data import DataObject
 from .exceptions import UnexpectedStatusCodeException
 from .gql import Query
 from .schema import Schema
 
+_READY_PATH = "/.well-known/ready"
+_LIVE_PATH = "/.well-known/live"
+
 
 class Client:
     """
@@ -146,7 +150,7 @@ class Client:
         """
 
         try:
-            response = self._connection.get(path="/.well-known/ready")
+            response = self._connection.get(path=_READY_PATH)
             if response.status_code == 200:
                 return True
             return False
@@ -164,14 +168,15 @@ class Client:
             False otherwise.
         """
 
-        response = self._connection.get(path="/.well-known/live")
+        response = self._connection.get(path=_LIVE_PATH)
         if response.status_code == 200:
             return True
         return False
 
     def get_meta(self) -> dict:
         """
-        Get the meta endpoint description of weaviate.
+        Get the meta endpoint description of weaviate. The description can be up to a minute
+        old, it is cached by the connection.
 
         Returns
         -------
@@ -184,8 +189,7 @@ class Client:
             If weaviate reports a none OK status.
         """
 
-        response = self._connection.get_meta()
-        return response.json()
+        return copy.deepcopy(self._connection.get_meta())
 
     def get_open_id_configuration(self) -> Optional[dict]:
         """
@@ -202,7 +206,7 @@ class Client:
             If weaviate reports a none OK status.
         """
 
-        response = self._connection.get(path="/.well-known/openid-configuration")
+        response = self._connection.get(path=_OIDC_CONFIG_PATH)
         if response.status_code == 200:
             return response.json()
         if response.status_code == 404:
@@ -239,6 +243,27 @@ class Client:
 
         self._connection.timeout_config = timeout_config
 
+    def close(self) -> None:
+        """
+        Close the connection to Weaviate, i.e. its pooled connections and the background token
+        refresh. The client should not be used afterwards. Called automatically when the client
+        is used as a context manager.
+
+        Examples
+        --------
+        >>> with weaviate.Client("http://localhost:8080") as client:
+        ...     client.is_ready()
+        True
+        """
+
+        self._connection.close()
+
+    def __enter__(self) -> "Client":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
     def __del__(self):
         # in case an exception happens before definition of these members
         if hasattr(self, "_connection"):
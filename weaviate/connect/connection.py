@@ -4,24 +4,171 @@ Connection class definition.
 from __future__ import annotations
 
 import datetime
+import gzip
 import os
+import socket
 import time
 
 from requests.exceptions import JSONDecodeError
 from numbers import Real
 from threading import Thread, Event
 from typing import Any, Dict, Tuple, Optional, Union
+from urllib.parse import urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.exceptions import MaxRetryError, ResponseError
+from urllib3.util.retry import Retry
 from authlib.integrations.requests_client import OAuth2Session
 
 from weaviate.auth import AuthCredentials, AuthClientCredentials
 from weaviate.connect.authentication import _Auth
 from weaviate.exceptions import AuthenticationFailedException, UnexpectedStatusCodeException
+from weaviate.util import _json_serialize, _LRUCache
 from weaviate.warnings import _Warnings
 
 Session = Union[requests.sessions.Session, OAuth2Session]
 
+# smaller payloads are not worth the compression overhead
+_GZIP_MIN_SIZE = 64 * 1024
+
+# number of connection pools (one per host) and connections kept alive per pool
+_POOL_CONNECTIONS = 10
+_POOL_MAXSIZE = 100
+
+# seconds a pooled connection may be idle before TCP keep-alive probes are sent
+_TCP_KEEPALIVE_IDLE = 60
+_TCP_KEEPALIVE_INTERVAL = 15
+_TCP_KEEPALIVE_PROBES = 4
+
+# retries of idempotent requests that failed with a connection error or a transient status,
+# waiting 0, 0.1 and 0.2 seconds before them
+_MAX_RETRIES = 3
+_RETRY_BACKOFF_FACTOR = 0.05
+_RETRY_METHODS = frozenset({"GET", "HEAD", "PUT", "PATCH", "DELETE"})
+_RETRY_STATUS_CODES = frozenset({429, 502, 503, 504})
+# the health endpoints report an instance that is not ready or live with a 503
+_HEALTH_PATHS = ("/.well-known/ready", "/.well-known/live")
+
+# seconds the response of the meta endpoint is reused for
+_META_CACHE_TTL = 60.0
+
+_META_PATH = "/meta"
+_OIDC_CONFIG_PATH = "/.well-known/openid-configuration"
+
+
+def _get_keepalive_socket_options() -> list:
+    """
+    Get the socket options that enable TCP keep-alive on top of the urllib3 default options, so
+    that idle pooled connections are not silently dropped by load balancers or NAT gateways.
+
+    Returns
+    -------
+    list
+        The socket options for the urllib3 connections.
+    """
+
+    socket_options = HTTPConnection.default_socket_options + [
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    ]
+    # the fine grained options are not available on every platform
+    for name, value in (
+        ("TCP_KEEPIDLE", _TCP_KEEPALIVE_IDLE),
+        ("TCP_KEEPINTVL", _TCP_KEEPALIVE_INTERVAL),
+        ("TCP_KEEPCNT", _TCP_KEEPALIVE_PROBES),
+    ):
+        if hasattr(socket, name):
+            socket_options.append((socket.IPPROTO_TCP, getattr(socket, name), value))
+    return socket_options
+
+
+class _KeepAliveHTTPAdapter(HTTPAdapter):
+    """
+    HTTPAdapter that enables TCP keep-alive on the pooled connections, including the connections
+    to a proxy.
+    """
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs.setdefault("socket_options", _get_keepalive_socket_options())
+        super().init_poolmanager(*args, **kwargs)
+
+    def proxy_manager_for(self, proxy, **proxy_kwargs):
+        # requests does not pass the pool manager options on to the (cached) proxy managers
+        proxy_kwargs.setdefault("socket_options", _get_keepalive_socket_options())
+        return super().proxy_manager_for(proxy, **proxy_kwargs)
+
+
+class _Retry(Retry):
+    """
+    Retry that returns a 503 response of the health endpoints at once, because it is their answer
+    and not a transient failure.
+    """
+
+    def increment(self, method=None, url=None, response=None, error=None, **kwargs):
+        if (
+            response is not None
+            and response.status == 503
+            and url is not None
+            and urlparse(url).path.endswith(_HEALTH_PATHS)
+        ):
+            # urllib3 returns the response when the retries are exhausted and `raise_on_status`
+            # is False
+            raise MaxRetryError(kwargs.get("_pool"), url, ResponseError("health check status"))
+        return super().increment(method, url, response=response, error=error, **kwargs)
+
+
+def _get_retry() -> Retry:
+    """
+    Get the retry configuration of the idempotent requests. POST requests are never retried,
+    because they might not be idempotent (e.g. creating an object without a uuid). A 503 of the
+    health endpoints is not retried either, see `_Retry`.
+
+    Returns
+    -------
+    urllib3.util.retry.Retry
+        The retry configuration.
+    """
+
+    kwargs = {
+        "total": _MAX_RETRIES,
+        "backoff_factor": _RETRY_BACKOFF_FACTOR,
+        "status_forcelist": _RETRY_STATUS_CODES,
+        # a read timeout must not be retried: the request may have been processed already, and the
+        # timeout configured by the user would be multiplied
+        "read": False,
+        # return the last response instead of raising, so it is reported like any other status
+        "raise_on_status": False,
+        # a server could make a request wait for any amount of time
+        "respect_retry_after_header": False,
+    }
+    try:
+        return _Retry(allowed_methods=_RETRY_METHODS, **kwargs)
+    except TypeError:  # urllib3 < 1.26
+        return _Retry(method_whitelist=_RETRY_METHODS, **kwargs)
+
+
+def _mount_keepalive_adapter(session: Session) -> None:
+    """
+    Mount a `_KeepAliveHTTPAdapter` on the session. All requests share the session, so its pool
+    keeps a connection alive for each concurrent request (e.g. batch workers) instead of
+    discarding them after 10. Idempotent requests are retried on transient failures, see
+    `_get_retry`.
+
+    Parameters
+    ----------
+    session : requests.Session or authlib OAuth2Session
+        The session to mount the adapter on.
+    """
+
+    adapter = _KeepAliveHTTPAdapter(
+        pool_connections=_POOL_CONNECTIONS,
+        pool_maxsize=_POOL_MAXSIZE,
+        max_retries=_get_retry(),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
 
 class BaseConnection:
     """
@@ -74,7 +221,7 @@ class BaseConnection:
         """
 
         self._api_version_path = "/v1"
-        self.url = url  # e.g. http://localhost:80
+        self.url = url  # e.g. http://localhost:80, this uses the setter
         self.timeout_config = timeout_config  # this uses the setter
 
         self._headers = {"content-type": "application/json"}
@@ -108,8 +255,12 @@ class BaseConnection:
         ValueError
             If no authentication credentials provided but the Weaviate server has OpenID configured.
         """
-        oidc_url = self.url + self._api_version_path + "/.well-known/openid-configuration"
-        response = requests.get(
+        oidc_url = self._api_url + _OIDC_CONFIG_PATH
+        # the discovery request goes through the session that is used afterwards if no
+        # authentication is needed, so its connection is reused by the following requests
+        session = requests.Session()
+        _mount_keepalive_adapter(session)
+        response = session.get(
             oidc_url,
             headers={"content-type": "application/json"},
             timeout=self._timeout_config,
@@ -123,28 +274,29 @@ class BaseConnection:
                 resp = response.json()
             except JSONDecodeError:
                 _Warnings.auth_cannot_parse_oidc_config(oidc_url)
-                self._session = requests.Session()
-                return
-
-            if auth_client_secret is not None:
-                _auth = _Auth(resp, auth_client_secret, self)
-                self._session = _auth.get_auth_session()
-
-                if isinstance(auth_client_secret, AuthClientCredentials):
-                    # credentials should only be saved for client credentials, otherwise use refresh token
-                    self._create_background_token_refresh(_auth)
-                else:
-                    self._create_background_token_refresh()
+                self._session = session
             else:
-                raise AuthenticationFailedException(
-                    f""""No login credentials provided. The weaviate instance at {self.url} requires login credential,
+                session.close()
+                if auth_client_secret is not None:
+                    _auth = _Auth(resp, auth_client_secret, self)
+                    self._session = _auth.get_auth_session()
+                    _mount_keepalive_adapter(self._session)
+
+                    if isinstance(auth_client_secret, AuthClientCredentials):
+                        # credentials should only be saved for client credentials, otherwise use refresh token
+                        self._create_background_token_refresh(_auth)
+                    else:
+                        self._create_background_token_refresh()
+                else:
+                    raise AuthenticationFailedException(
+                        f""""No login credentials provided. The weaviate instance at {self.url} requires login credential,
                     use argument 'auth_client_secret'."""
-                )
+                    )
         elif response.status_code == 404 and auth_client_secret is not None:
             _Warnings.auth_with_anon_weaviate()
-            self._session = requests.Session()
+            self._session = session
         else:
-            self._session = requests.Session()
+            self._session = session
 
     def _create_background_token_refresh(self, _auth: Optional[_Auth] = None):
         """Create a background thread that periodically refreshes access and refresh tokens.
@@ -234,11 +386,11 @@ class BaseConnection:
             If the DELETE request could not be made.
         """
 
-        request_url = self.url + self._api_version_path + path
+        request_url = self._api_url + path
 
         return self._session.delete(
             url=request_url,
-            json=weaviate_object,
+            data=_json_serialize(weaviate_object),
             headers=self._get_request_header(),
             timeout=self._timeout_config,
             proxies=self._proxies,
@@ -271,11 +423,11 @@ class BaseConnection:
             If the PATCH request could not be made.
         """
 
-        request_url = self.url + self._api_version_path + path
+        request_url = self._api_url + path
 
         return self._session.patch(
             url=request_url,
-            json=weaviate_object,
+            data=_json_serialize(weaviate_object),
             headers=self._get_request_header(),
             timeout=self._timeout_config,
             proxies=self._proxies,
@@ -285,6 +437,7 @@ class BaseConnection:
         self,
         path: str,
         weaviate_object: dict,
+        compress: bool = False,
     ) -> requests.Response:
         """
         Make a POST request to the Weaviate server instance.
@@ -296,7 +449,9 @@ class BaseConnection:
             e.g. '/meta' or '/objects', without version.
         weaviate_object : dict
             Object is used as payload for POST request.
-        external_url: Is an external (non-weaviate) url called
+        compress : bool, optional
+            Whether to gzip the payload if it is larger than 64KiB. The server (or a proxy in front
+            of it) must accept gzip encoded request bodies. By default False.
 
         Returns
         -------
@@ -308,12 +463,19 @@ class BaseConnection:
         requests.ConnectionError
             If the POST request could not be made.
         """
-        request_url = self.url + self._api_version_path + path
+        request_url = self._api_url + path
+
+        data = _json_serialize(weaviate_object)
+        headers = self._get_request_header()
+        if compress and len(data) > _GZIP_MIN_SIZE:
+            # the lowest level is still a net win on anything slower than a 10Gbit link
+            data = gzip.compress(data, compresslevel=1)
+            headers = {**headers, "content-encoding": "gzip"}
 
         return self._session.post(
             url=request_url,
-            json=weaviate_object,
-            headers=self._get_request_header(),
+            data=data,
+            headers=headers,
             timeout=self._timeout_config,
             proxies=self._proxies,
         )
@@ -345,11 +507,11 @@ class BaseConnection:
             If the PUT request could not be made.
         """
 
-        request_url = self.url + self._api_version_path + path
+        request_url = self._api_url + path
 
         return self._session.put(
             url=request_url,
-            json=weaviate_object,
+            data=_json_serialize(weaviate_object),
             headers=self._get_request_header(),
             timeout=self._timeout_config,
             proxies=self._proxies,
@@ -384,7 +546,7 @@ class BaseConnection:
         if external_url:
             request_url = path
         else:
-            request_url = self.url + self._api_version_path + path
+            request_url = self._api_url + path
 
         return self._session.get(
             url=request_url,
@@ -415,7 +577,7 @@ class BaseConnection:
             If the HEAD request could not be made.
         """
 
-        request_url = self.url + self._api_version_path + path
+        request_url = self._api_url + path
 
         return self._session.head(
             url=request_url,
@@ -454,6 +616,34 @@ class BaseConnection:
 
         self._timeout_config = _get_valid_timeout_config(timeout_config)
 
+    @property
+    def url(self) -> str:
+        """
+        Getter/setter for `url`.
+
+        Parameters
+        ----------
+        url : str
+            For Setter only: The URL of the Weaviate server, e.g. http://localhost:80.
+
+        Returns
+        -------
+        str
+            For Getter only: The URL of the Weaviate server.
+        """
+
+        return self._url
+
+    @url.setter
+    def url(self, url: str):
+        """
+        Setter for `url`. (docstring should be only in the Getter)
+        """
+
+        self._url = url
+        # the versioned API URL that every request path is appended to, built only once
+        self._api_url = url + self._api_version_path
+
     @property
     def proxies(self) -> dict:
         return self._proxies
@@ -469,6 +659,7 @@ class Connection(BaseConnection):
         trust_env: bool,
         additional_headers: Optional[Dict[str, Any]],
     ):
+        self._meta_cache = _LRUCache(maxsize=1, ttl=_META_CACHE_TTL)
         super().__init__(
             url, auth_client_secret, timeout_config, proxies, trust_env, additional_headers
         )
@@ -482,10 +673,16 @@ class Connection(BaseConnection):
         return self.get_meta()["version"]
 
     def get_meta(self) -> Dict[str, str]:
-        """Returns the meta endpoint."""
-        response = self.get(path="/meta")
+        """Returns the meta endpoint. The response is reused for `_META_CACHE_TTL` seconds, so
+        that the frequent server version checks do not each cost a request."""
+        meta = self._meta_cache.get(_META_PATH)
+        if meta is not None:
+            return meta
+        response = self.get(path=_META_PATH)
         if response.status_code == 200:
-            return response.json()
+            meta = response.json()
+            self._meta_cache.put(_META_PATH, meta)
+            return meta
         raise UnexpectedStatusCodeException("Meta endpoint", response)
 
 
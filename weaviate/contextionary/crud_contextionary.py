@@ -1,10 +1,15 @@
 """
 Contextionary class definition.
 """
+from copy import deepcopy
+from numbers import Real
+from typing import Optional
+
 from requests.exceptions import ConnectionError as RequestsConnectionError
 
 from weaviate.connect import Connection
 from weaviate.exceptions import UnexpectedStatusCodeException
+from weaviate.util import _check_positive_num, _decode_json, _LRUCache, _SingleFlight
 
 
 class Contextionary:
@@ -24,6 +29,43 @@ class Contextionary:
         """
 
         self._connection = connection
+        self._concept_vector_cache: Optional[_LRUCache] = None
+        # concurrent cached calls for the same concept share one request
+        self._concept_vector_requests = _SingleFlight()
+
+    def enable_concept_vector_cache(self, maxsize: int = 1024, ttl: Real = 600) -> None:
+        """
+        Cache the concept vectors returned by `get_concept_vector`, so that repeated calls for
+        the same concept do not query weaviate again. Concurrent calls for a concept that is not
+        cached yet share a single request. The cache is cleared when the contextionary is
+        extended through this Contextionary. Extensions made in any other way are only seen once
+        the cached concept vector expired.
+
+        Parameters
+        ----------
+        maxsize : int, optional
+            The maximum number of cached concept vectors, by default 1024.
+        ttl : Real, optional
+            The number of seconds a concept vector is cached for, by default 600.
+
+        Raises
+        ------
+        TypeError
+            If argument is of wrong type.
+        ValueError
+            If argument contains an invalid value.
+        """
+
+        _check_positive_num(maxsize, "maxsize", int)
+        _check_positive_num(ttl, "ttl", Real)
+        self._concept_vector_cache = _LRUCache(maxsize=maxsize, ttl=ttl)
+
+    def disable_concept_vector_cache(self) -> None:
+        """
+        Stop caching concept vectors and drop all the cached concept vectors.
+        """
+
+        self._concept_vector_cache = None
 
     def extend(self, concept: str, definition: str, weight: float = 1.0) -> None:
         """
@@ -82,13 +124,15 @@ class Contextionary:
                 "text2vec-contextionary could not be extended."
             ) from conn_err
         if response.status_code == 200:
-            # Successfully extended
+            # Successfully extended, the extension can change the vectors of other concepts too
+            self.invalidate_concept_vector_cache()
             return
         raise UnexpectedStatusCodeException("Extend text2vec-contextionary", response)
 
     def get_concept_vector(self, concept: str) -> dict:
         """
-        Retrieves the vector representation of the given concept.
+        Retrieves the vector representation of the given concept. See
+        `enable_concept_vector_cache` to cache the retrieved concept vectors.
 
         Parameters
         ----------
@@ -143,6 +187,72 @@ class Contextionary:
             If weaviate reports a none OK status.
         """
 
+        concept_vector_cache = self._concept_vector_cache  # might be disabled concurrently
+        if concept_vector_cache is None:
+            return self._get_concept_vector(concept)
+
+        concept_vector = concept_vector_cache.get(concept)
+        if concept_vector is None:
+            concept_vector = self._concept_vector_requests.do(
+                concept, lambda: self._get_and_cache_concept_vector(concept, concept_vector_cache)
+            )
+        # the cached/shared concept vector must not be changed by the caller
+        return deepcopy(concept_vector)
+
+    def _get_and_cache_concept_vector(self, concept: str, concept_vector_cache: _LRUCache) -> dict:
+        """
+        Retrieves the vector representation of the given concept and caches it, unless it was
+        cached in the meantime.
+
+        Parameters
+        ----------
+        concept : str
+            Concept for which the vector should be retrieved.
+        concept_vector_cache : weaviate.util._LRUCache
+            The cache to check and to add the concept vector to.
+
+        Returns
+        -------
+        dict
+            A dictionary containing info and the vector/s of the concept.
+
+        Raises
+        ------
+        requests.ConnectionError
+            If the network connection to weaviate fails.
+        weaviate.UnexpectedStatusCodeException
+            If weaviate reports a none OK status.
+        """
+
+        # a concurrent request for the concept might have finished since the cache was checked
+        concept_vector = concept_vector_cache.get(concept)
+        if concept_vector is None:
+            concept_vector = self._get_concept_vector(concept)
+            concept_vector_cache.put(concept, concept_vector)
+        return concept_vector
+
+    def _get_concept_vector(self, concept: str) -> dict:
+        """
+        Retrieves the vector representation of the given concept from Weaviate.
+
+        Parameters
+        ----------
+        concept : str
+            Concept for which the vector should be retrieved.
+
+        Returns
+        -------
+        dict
+            A dictionary containing info and the vector/s of the concept.
+
+        Raises
+        ------
+        requests.ConnectionError
+            If the network connection to weaviate fails.
+        weaviate.UnexpectedStatusCodeException
+            If weaviate reports a none OK status.
+        """
+
         path = "/modules/text2vec-contextionary/concepts/" + concept
         try:
             response = self._connection.get(path=path)
@@ -152,5 +262,20 @@ class Contextionary:
             ) from conn_err
         else:
             if response.status_code == 200:
-                return response.json()
+                return _decode_json(response)
             raise UnexpectedStatusCodeException("text2vec-contextionary vector", response)
+
+    def invalidate_concept_vector_cache(self, concept: Optional[str] = None) -> None:
+        """
+        Remove cached concept vectors, see `enable_concept_vector_cache`.
+
+        Parameters
+        ----------
+        concept : str or None, optional
+            The concept to remove from the cache, if None the whole cache is cleared,
+            by default None.
+        """
+
+        concept_vector_cache = self._concept_vector_cache  # might be disabled concurrently
+        if concept_vector_cache is not None:
+            concept_vector_cache.invalidate(concept)
@@ -3,7 +3,10 @@ DataObject class definition.
 """
 import uuid as uuid_lib
 import warnings
-from typing import Union, Optional, List, Sequence
+from copy import deepcopy
+from numbers import Real
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Union, Optional, List, Sequence, Iterator, Tuple
 
 from requests.exceptions import ConnectionError as RequestsConnectionError
 
@@ -14,15 +17,29 @@ from weaviate.error_msgs import DATA_DEPRECATION_NEW_V14_CLS_NS_W, DATA_DEPRECAT
 from weaviate.exceptions import (
     ObjectAlreadyExistsException,
     UnexpectedStatusCodeException,
+    WeaviateBaseError,
 )
 from weaviate.util import (
     _get_dict_from_object,
-    get_vector,
     get_valid_uuid,
     _capitalize_first_letter,
     _check_positive_num,
+    _decode_json,
+    _get_batch_error_messages,
+    _json_serialize,
+    _LRUCache,
+    _map_concurrently,
+    _get_vector_payload,
+    _round_vector,
+    _SingleFlight,
 )
 
+if TYPE_CHECKING:
+    import numpy
+
+# number of invalidation counters of the read cache, objects share counters by the hash of the uuid
+_READ_GENERATIONS = 1024
+
 
 class DataObject:
     """
@@ -46,6 +63,192 @@ class DataObject:
 
         self._connection = connection
         self.reference = Reference(self._connection)
+        self._read_cache: Optional[_LRUCache] = None
+        # concurrent cached reads of the same object share one request
+        self._read_requests = _SingleFlight()
+        # bumped when the cached reads of an object are invalidated, so that a read that was in
+        # flight meanwhile is not cached
+        self._read_generations = [0] * _READ_GENERATIONS
+        self._read_cache_lock = Lock()
+        self._validation_cache: Optional[_LRUCache] = None
+        self._vector_decimals: Optional[int] = None
+
+    def enable_read_cache(self, maxsize: int = 1024, ttl: Real = 60) -> None:
+        """
+        Cache the objects returned by `get_by_id`/`get` (with a uuid) and the objects found by
+        `exists`, so that repeated reads of the same object do not query weaviate again.
+        Concurrent reads of an object that is not cached yet share a single request.
+        Cached objects are invalidated when they are updated, replaced or deleted through this
+        DataObject. Changes made in any other way (e.g. by other clients, batches or references)
+        are only seen once the cached object expired.
+
+        Parameters
+        ----------
+        maxsize : int, optional
+            The maximum number of cached reads, by default 1024.
+        ttl : Real, optional
+            The number of seconds a read is cached for, by default 60.
+
+        Raises
+        ------
+        TypeError
+            If argument is of wrong type.
+        ValueError
+            If argument contains an invalid value.
+        """
+
+        _check_positive_num(maxsize, "maxsize", int)
+        _check_positive_num(ttl, "ttl", Real)
+        self._read_cache = _LRUCache(maxsize=maxsize, ttl=ttl)
+
+    def disable_read_cache(self) -> None:
+        """
+        Stop caching reads and drop all the cached reads.
+        """
+
+        self._read_cache = None
+
+    def enable_validation_cache(self, maxsize: int = 512, ttl: Real = 30) -> None:
+        """
+        Cache the objects that `validate` found to be valid, so that validating the same object
+        again, e.g. right before creating it, does not query weaviate again. Invalid objects are
+        not cached. Schema changes are only seen once the cached validation expired.
+
+        Parameters
+        ----------
+        maxsize : int, optional
+            The maximum number of cached validations, by default 512.
+        ttl : Real, optional
+            The number of seconds a validation is cached for, by default 30.
+
+        Raises
+        ------
+        TypeError
+            If argument is of wrong type.
+        ValueError
+            If argument contains an invalid value.
+        """
+
+        _check_positive_num(maxsize, "maxsize", int)
+        _check_positive_num(ttl, "ttl", Real)
+        self._validation_cache = _LRUCache(maxsize=maxsize, ttl=ttl)
+
+    def disable_validation_cache(self) -> None:
+        """
+        Stop caching validations and drop all the cached validations.
+        """
+
+        self._validation_cache = None
+
+    def set_vector_precision(self, decimals: Optional[int] = None) -> None:
+        """
+        Round the vectors that are sent to weaviate to a number of decimals, which makes the
+        requests of `create`, `create_many`, `update`, `replace` and `validate` smaller, e.g. a
+        1536 dimensional float32 embedding rounded to 4 decimals takes about a third fewer bytes.
+        This only reduces the size of the requests, weaviate still stores and indexes the
+        (rounded) vectors with full precision.
+
+        Parameters
+        ----------
+        decimals : Optional[int], optional
+            The number of decimals to keep, if None the vectors are sent as they are,
+            by default None.
+
+        Raises
+        ------
+        TypeError
+            If argument is of wrong type.
+        ValueError
+            If argument contains an invalid value.
+        """
+
+        if decimals is not None:
+            _check_positive_num(decimals, "decimals", int)
+        self._vector_decimals = decimals
+
+    def _get_vector(self, vector: Sequence) -> Union[list, "numpy.ndarray"]:
+        """
+        Get the vector to send to weaviate, see `_get_vector_payload` and `set_vector_precision`.
+
+        Parameters
+        ----------
+        vector : Sequence
+            The embedding of an object.
+
+        Returns
+        -------
+        list or numpy.ndarray
+            The embedding.
+
+        Raises
+        ------
+        TypeError
+            If 'vector' is not of a supported type.
+        """
+
+        vector = _get_vector_payload(vector)
+        if self._vector_decimals is not None:
+            vector = _round_vector(vector, self._vector_decimals)
+        return vector
+
+    def _invalidate_read_cache(self, uuid: str) -> None:
+        """
+        Drop all the cached reads of an object.
+
+        Parameters
+        ----------
+        uuid : str
+            The valid UUID of the object.
+        """
+
+        read_cache = self._read_cache  # the cache might be disabled concurrently
+        if read_cache is None:
+            return
+        with self._read_cache_lock:
+            self._read_generations[hash(uuid) % _READ_GENERATIONS] += 1
+            read_cache.invalidate_if(lambda key: key[0] == uuid)
+
+    def _get_read_generation(self, cache_key: Optional[tuple]) -> Optional[int]:
+        """
+        Get the current invalidation counter of the object of a read, see `_cache_read`.
+
+        Parameters
+        ----------
+        cache_key : Optional[tuple]
+            The read cache key, starting with the valid UUID of the object.
+
+        Returns
+        -------
+        Optional[int]
+            The invalidation counter, None if `cache_key` is None.
+        """
+
+        if cache_key is None:
+            return None
+        return self._read_generations[hash(cache_key[0]) % _READ_GENERATIONS]
+
+    def _cache_read(self, cache_key: tuple, result: Any, generation: int) -> None:
+        """
+        Cache a read, unless the cached reads of the object were invalidated since the read
+        was sent.
+
+        Parameters
+        ----------
+        cache_key : tuple
+            The read cache key, starting with the valid UUID of the object.
+        result : Any
+            The result of the read.
+        generation : int
+            The invalidation counter of the object before the read was sent, see
+            `_get_read_generation`.
+        """
+
+        read_cache = self._read_cache  # the cache might be disabled concurrently
+        if read_cache is None:
+            return
+        with self._read_cache_lock:
+            if self._get_read_generation(cache_key) == generation:
+                read_cache.put(cache_key, result)
 
     def create(
         self,
@@ -114,6 +317,175 @@ class DataObject:
             If the network connection to weaviate fails.
         """
 
+        weaviate_obj = self._create_object(data_object, class_name, uuid, vector)
+
+        path = "/objects"
+        try:
+            response = self._connection.post(path=path, weaviate_object=weaviate_obj)
+        except RequestsConnectionError as conn_err:
+            raise RequestsConnectionError("Object was not added to Weaviate.") from conn_err
+        if response.status_code == 200:
+            return str(_decode_json(response)["id"])
+
+        # weaviate reports existing objects as unprocessable, check the status before the body
+        if response.status_code == 422 and b"already exists" in response.content:
+            raise ObjectAlreadyExistsException(str(uuid))
+        raise UnexpectedStatusCodeException("Creating object", response)
+
+    def create_many(
+        self,
+        objects: Sequence[dict],
+        batch_size: int = 100,
+        concurrency: int = 1,
+    ) -> List[str]:
+        """
+        Add multiple objects to weaviate with requests to the batch endpoint, each one with up to
+        `batch_size` objects. Unlike `create`, an object with the uuid of an existing object
+        replaces the existing object.
+
+        Parameters
+        ----------
+        objects : Sequence[dict]
+            The objects to be added. Each object is a dict with the keyword arguments of the
+            `create` method, i.e. 'data_object', 'class_name' and optionally 'uuid' and 'vector'.
+        batch_size : int, optional
+            The maximal number of objects sent with each request, by default 100.
+        concurrency : int, optional
+            The maximal number of requests sent at the same time, by default 1.
+
+        Examples
+        --------
+        >>> client.data_object.create_many(
+        ...     [
+        ...         {'data_object': {'name': 'Neil Gaiman', 'age': 60}, 'class_name': 'Author'},
+        ...         {
+        ...             'data_object': {'name': 'Andrzej Sapkowski', 'age': 72},
+        ...             'class_name': 'Author',
+        ...             'uuid': 'e067f671-1202-42c6-848b-ff4d1eb804ab',
+        ...         },
+        ...     ]
+        ... )
+        ['46091506-e3a0-41a4-9597-10e3064d8e2d', 'e067f671-1202-42c6-848b-ff4d1eb804ab']
+
+        Returns
+        -------
+        List[str]
+            The UUIDs of the created objects, in the same order as `objects`.
+
+        Raises
+        ------
+        TypeError
+            If argument is of wrong type.
+        ValueError
+            If argument contains an invalid value.
+        weaviate.UnexpectedStatusCodeException
+            If weaviate reports a none OK status. The other objects may have been created.
+        weaviate.WeaviateBaseError
+            If creating some of the objects failed, the error message lists the failed objects
+            with their errors. The other objects may have been created.
+        requests.ConnectionError
+            If the network connection to weaviate fails.
+        """
+
+        _check_positive_num(batch_size, "batch_size", int)
+        weaviate_objs = [self._create_object(**object_) for object_ in objects]
+        batches = []
+        for start in range(0, len(weaviate_objs), batch_size):
+            end = start + batch_size
+            batches.append(weaviate_objs[start:end])
+        return [
+            uuid
+            for batch_uuids in _map_concurrently(self._create_batch, batches, concurrency)
+            for uuid in batch_uuids
+        ]
+
+    def _create_batch(self, weaviate_objs: List[dict]) -> List[str]:
+        """
+        Add objects to weaviate with a single request to the batch endpoint, see `create_many`.
+
+        Parameters
+        ----------
+        weaviate_objs : List[dict]
+            The weaviate objects, see `_create_object`.
+
+        Returns
+        -------
+        List[str]
+            The UUIDs of the created objects, in the same order as `weaviate_objs`.
+
+        Raises
+        ------
+        weaviate.UnexpectedStatusCodeException
+            If weaviate reports a none OK status.
+        weaviate.WeaviateBaseError
+            If creating some of the objects failed.
+        requests.ConnectionError
+            If the network connection to weaviate fails.
+        """
+
+        try:
+            response = self._connection.post(
+                path="/batch/objects",
+                weaviate_object={"fields": ["ALL"], "objects": weaviate_objs},
+            )
+        except RequestsConnectionError as conn_err:
+            raise RequestsConnectionError("Objects were not added to Weaviate.") from conn_err
+        finally:
+            # existing objects are replaced, even if the response reports an error
+            for weaviate_obj in weaviate_objs:
+                if "id" in weaviate_obj:
+                    self._invalidate_read_cache(weaviate_obj["id"])
+        if response.status_code != 200:
+            raise UnexpectedStatusCodeException("Creating objects", response)
+
+        results = _decode_json(response)
+        # the batch endpoint responds with 200 even if some of the objects failed
+        failures = []
+        for result in results:
+            messages = _get_batch_error_messages(result)
+            if messages:
+                failures.append(f"{result.get('id')}: {', '.join(messages)}")
+        if failures:
+            raise WeaviateBaseError(
+                f"Creating {len(failures)} of {len(results)} objects failed: " + "; ".join(failures)
+            )
+        return [str(result["id"]) for result in results]
+
+    def _create_object(
+        self,
+        data_object: Union[dict, str],
+        class_name: str,
+        uuid: Union[str, uuid_lib.UUID, None] = None,
+        vector: Optional[Sequence] = None,
+    ) -> dict:
+        """
+        Build the weaviate object that is sent to create an object.
+
+        Parameters
+        ----------
+        data_object : dict or str
+            Object to be added.
+            If type is str it should be either a URL or a file.
+        class_name : str
+            Class name associated with the object given.
+        uuid : str, uuid.UUID or None, optional
+            The uuid of the object, by default None.
+        vector: Sequence or None, optional
+            Embedding for the object, by default None.
+
+        Returns
+        -------
+        dict
+            The weaviate object.
+
+        Raises
+        ------
+        TypeError
+            If argument is of wrong type.
+        ValueError
+            If argument contains an invalid value.
+        """
+
         if not isinstance(class_name, str):
             raise TypeError(f"Expected class_name of type str but was: {type(class_name)}")
         loaded_data_object = _get_dict_from_object(data_object)
@@ -126,25 +498,8 @@ class DataObject:
             weaviate_obj["id"] = get_valid_uuid(uuid)
 
         if vector is not None:
-            weaviate_obj["vector"] = get_vector(vector)
-
-        path = "/objects"
-        try:
-            response = self._connection.post(path=path, weaviate_object=weaviate_obj)
-        except RequestsConnectionError as conn_err:
-            raise RequestsConnectionError("Object was not added to Weaviate.") from conn_err
-        if response.status_code == 200:
-            return str(response.json()["id"])
-
-        object_does_already_exist = False
-        try:
-            if "already exists" in response.json()["error"][0]["message"]:
-                object_does_already_exist = True
-        except KeyError:
-            pass
-        if object_does_already_exist:
-            raise ObjectAlreadyExistsException(str(uuid))
-        raise UnexpectedStatusCodeException("Creating object", response)
+            weaviate_obj["vector"] = self._get_vector(vector)
+        return weaviate_obj
 
     def update(
         self,
@@ -234,9 +589,48 @@ class DataObject:
             raise RequestsConnectionError("Object was not updated.") from conn_err
         if response.status_code == 204:
             # Successful merge
+            self._invalidate_read_cache(weaviate_obj["id"])
             return
         raise UnexpectedStatusCodeException("Update of the object not successful", response)
 
+    def update_many(self, objects: Sequence[dict], concurrency: int = 32) -> None:
+        """
+        Update multiple objects in weaviate, sending the requests concurrently. See `update`.
+
+        Parameters
+        ----------
+        objects : Sequence[dict]
+            The object updates. Each one is a dict with the keyword arguments of the `update`
+            method, i.e. 'data_object', 'class_name', 'uuid' and optionally 'vector'.
+        concurrency : int, optional
+            The maximal number of requests sent at the same time. The connection pool keeps
+            up to 100 connections alive, so higher values only open short lived connections,
+            by default 32.
+
+        Raises
+        ------
+        TypeError
+            If argument is of wrong type.
+        ValueError
+            If argument contains an invalid value.
+        requests.ConnectionError
+            If the network connection to weaviate fails.
+        weaviate.UnexpectedStatusCodeException
+            If weaviate reports a none successful status. If multiple updates failed, the error
+            of the first of them is raised, after all the other updates were sent.
+        """
+
+        def update(object_: dict) -> Optional[Exception]:
+            try:
+                self.update(**object_)
+            except (RequestsConnectionError, UnexpectedStatusCodeException) as error:
+                return error
+            return None
+
+        for error in _map_concurrently(update, objects, concurrency):
+            if error is not None:
+                raise error
+
     def replace(
         self,
         data_object: Union[dict, str],
@@ -321,6 +715,7 @@ class DataObject:
             raise RequestsConnectionError("Object was not replaced.") from conn_err
         if response.status_code == 200:
             # Successful update
+            self._invalidate_read_cache(weaviate_obj["id"])
             return
         raise UnexpectedStatusCodeException("Replace object", response)
 
@@ -345,7 +740,7 @@ class DataObject:
         }
 
         if vector is not None:
-            weaviate_obj["vector"] = get_vector(vector)
+            weaviate_obj["vector"] = self._get_vector(vector)
 
         is_server_version_14 = self._connection.server_version >= "1.14"
 
@@ -429,6 +824,69 @@ class DataObject:
             consistency_level=consistency_level,
         )
 
+    def get_many(
+        self,
+        uuids: Sequence[Union[str, uuid_lib.UUID]],
+        additional_properties: List[str] = None,
+        with_vector: bool = False,
+        class_name: Optional[str] = None,
+        concurrency: int = 32,
+        stream: bool = False,
+    ) -> Union[List[Optional[dict]], Iterator[Tuple[Union[str, uuid_lib.UUID], Optional[dict]]]]:
+        """
+        Get multiple objects from weaviate, sending the requests concurrently.
+
+        Parameters
+        ----------
+        uuids : Sequence of str or uuid.UUID
+            The identifiers of the objects that should be retrieved.
+        additional_properties : list of str, optional
+            list of additional properties that should be included in the request,
+            by default None
+        with_vector : bool
+            If True the `vector` property will be returned too,
+            by default False
+        class_name : Optional[str], optional
+            The class name of the objects, see `get_by_id`, by default None
+        concurrency : int, optional
+            The maximal number of requests sent at the same time. The connection pool keeps
+            up to 100 connections alive, so higher values only open short lived connections,
+            by default 32.
+        stream : bool, optional
+            If True, return an iterator of `(uuid, result)` tuples in the order the requests
+            complete, so that the results can be processed while other requests are still
+            running, by default False.
+
+        Returns
+        -------
+        List[Optional[dict]] or Iterator[Tuple[str or uuid.UUID, Optional[dict]]]
+            The objects in the same order as `uuids`, None for the objects that were not found.
+            If `stream` is True, an iterator of the uuids and their objects instead.
+
+        Raises
+        ------
+        TypeError
+            If argument is of wrong type.
+        ValueError
+            If argument contains an invalid value.
+        requests.ConnectionError
+            If the network connection to weaviate fails.
+        weaviate.UnexpectedStatusCodeException
+            If weaviate reports a none OK status.
+        """
+
+        return _map_concurrently(
+            lambda uuid: self.get_by_id(
+                uuid=uuid,
+                additional_properties=additional_properties,
+                with_vector=with_vector,
+                class_name=class_name,
+            ),
+            uuids,
+            concurrency,
+            stream,
+        )
+
     def get(
         self,
         uuid: Union[str, uuid_lib.UUID, None] = None,
@@ -438,6 +896,7 @@ class DataObject:
         node_name: Optional[str] = None,
         consistency_level: Optional[ConsistencyLevel] = None,
         limit: Optional[int] = None,
+        after: Union[str, uuid_lib.UUID, None] = None,
     ) -> List[dict]:
         """
         Gets objects from weaviate, the maximum number of objects returned is 100.
@@ -468,6 +927,11 @@ class DataObject:
         limit: Optional[int], optional
             The maximum number of data objects to return.
             by default None, which uses the weaviate default of 100 entries
+        after: str, uuid.UUID or None, optional
+            Only return the objects after the object with this UUID, used as a cursor to page
+            through all the objects of `class_name`. Introduced in Weaviate version v1.18.0. See
+            `get_iterator` to iterate over all the objects page by page,
+            by default None
 
         Returns
         -------
@@ -515,7 +979,8 @@ class DataObject:
             path = "/objects"
 
         if uuid is not None:
-            path += "/" + get_valid_uuid(uuid)
+            uuid = get_valid_uuid(uuid)
+            path += "/" + uuid
 
         if consistency_level is not None:
             params["consistency_level"] = validate_consistency_level(consistency_level)
@@ -527,6 +992,51 @@ class DataObject:
             _check_positive_num(limit, "limit", int)
             params["limit"] = limit
 
+        if after is not None:
+            params["after"] = get_valid_uuid(after)
+
+        if uuid is None or self._read_cache is None:
+            return self._get(path, params)
+
+        cache_key = (uuid, "get", path, tuple(sorted(params.items())))
+        result = self._read_cache.get(cache_key)
+        if result is None:
+            # a read sent before a change of the object must not be shared with the reads after it
+            generation = self._get_read_generation(cache_key)
+            result = self._read_requests.do(
+                (cache_key, generation), lambda: self._get(path, params, cache_key)
+            )
+        # the cached/shared object must not be changed by the caller
+        return deepcopy(result)
+
+    def _get(self, path: str, params: dict, cache_key: Optional[tuple] = None) -> Optional[dict]:
+        """
+        Get objects from weaviate, see `get`.
+
+        Parameters
+        ----------
+        path : str
+            The path of the object/s.
+        params : dict
+            The query parameters.
+        cache_key : Optional[tuple], optional
+            The read cache key to cache a found object with, if None it is not cached,
+            by default None.
+
+        Returns
+        -------
+        Optional[dict]
+            The object/s or None if the object was not found.
+
+        Raises
+        ------
+        requests.ConnectionError
+            If the network connection to weaviate fails.
+        weaviate.UnexpectedStatusCodeException
+            If weaviate reports a none OK status.
+        """
+
+        generation = self._get_read_generation(cache_key)
         try:
             response = self._connection.get(
                 path=path,
@@ -535,11 +1045,79 @@ class DataObject:
         except RequestsConnectionError as conn_err:
             raise RequestsConnectionError("Could not get object/s.") from conn_err
         if response.status_code == 200:
-            return response.json()
+            result = _decode_json(response)
+            if cache_key is not None:
+                self._cache_read(cache_key, result, generation)
+            return result
         if response.status_code == 404:
             return None
         raise UnexpectedStatusCodeException("Get object/s", response)
 
+    def get_iterator(
+        self,
+        class_name: str,
+        batch_size: int = 100,
+        additional_properties: List[str] = None,
+        with_vector: bool = False,
+    ) -> Iterator[dict]:
+        """
+        Iterate over all the objects of a class, getting them from weaviate one page of
+        `batch_size` objects at a time instead of all at once. Introduced in Weaviate version
+        v1.18.0.
+
+        Parameters
+        ----------
+        class_name : str
+            The class name of the objects.
+        batch_size : int, optional
+            The number of objects to get with each request, by default 100.
+        additional_properties : list of str, optional
+            list of additional properties that should be included in the request,
+            by default None
+        with_vector : bool
+            If True the `vector` property will be returned too,
+            by default False
+
+        Examples
+        --------
+        >>> for author in client.data_object.get_iterator(class_name='Author'):
+        ...     print(author['properties']['name'])
+
+        Returns
+        -------
+        Iterator[dict]
+            The objects of the class.
+
+        Raises
+        ------
+        TypeError
+            If argument is of wrong type.
+        ValueError
+            If argument contains an invalid value.
+        requests.ConnectionError
+            If the network connection to weaviate fails.
+        weaviate.UnexpectedStatusCodeException
+            If weaviate reports a none OK status.
+        """
+
+        if not isinstance(class_name, str):
+            raise TypeError(f"'class_name' must be of type str. Given type: {type(class_name)}")
+        _check_positive_num(batch_size, "batch_size", int)
+
+        after = None
+        while True:
+            objects = self.get(
+                additional_properties=additional_properties,
+                with_vector=with_vector,
+                class_name=class_name,
+                limit=batch_size,
+                after=after,
+            )["objects"]
+            yield from objects
+            if len(objects) < batch_size:
+                return
+            after = objects[-1]["id"]
+
     def delete(
         self,
         uuid: Union[str, uuid_lib.UUID],
@@ -631,9 +1209,44 @@ class DataObject:
             raise RequestsConnectionError("Object could not be deleted.") from conn_err
         if response.status_code == 204:
             # Successfully deleted
+            self._invalidate_read_cache(uuid)
             return
         raise UnexpectedStatusCodeException("Delete object", response)
 
+    def delete_many(
+        self,
+        uuids: Sequence[Union[str, uuid_lib.UUID]],
+        class_name: Optional[str] = None,
+        concurrency: int = 32,
+    ) -> None:
+        """
+        Delete multiple existing objects from weaviate, sending the requests concurrently.
+
+        Parameters
+        ----------
+        uuids : Sequence of str or uuid.UUID
+            The IDs of the objects to be deleted.
+        class_name : Optional[str], optional
+            The class name of the objects, see `delete`, by default None
+        concurrency : int, optional
+            The maximal number of requests sent at the same time. The connection pool keeps
+            up to 100 connections alive, so higher values only open short lived connections,
+            by default 32.
+
+        Raises
+        ------
+        requests.ConnectionError
+            If the network connection to weaviate fails.
+        weaviate.UnexpectedStatusCodeException
+            If weaviate reports a none OK status.
+        TypeError
+            If parameter has the wrong type.
+        ValueError
+            If uuid is not properly formed.
+        """
+
+        _map_concurrently(lambda uuid: self.delete(uuid, class_name), uuids, concurrency)
+
     def exists(
         self,
         uuid: Union[str, uuid_lib.UUID],
@@ -705,11 +1318,50 @@ class DataObject:
             if not isinstance(class_name, str):
                 raise TypeError(f"'class_name' must be of type str. Given type: {type(class_name)}")
 
+        uuid = get_valid_uuid(uuid)
         if class_name and is_server_version_14:
-            path = f"/objects/{_capitalize_first_letter(class_name)}/{get_valid_uuid(uuid)}"
+            path = f"/objects/{_capitalize_first_letter(class_name)}/{uuid}"
         else:
-            path = f"/objects/{get_valid_uuid(uuid)}"
+            path = f"/objects/{uuid}"
+
+        if self._read_cache is None:
+            return self._exists(path)
 
+        # only found objects are cached, so creating an object needs no invalidation
+        cache_key = (uuid, "exists", path)
+        if self._read_cache.get(cache_key, False):
+            return True
+        generation = self._get_read_generation(cache_key)
+        return self._read_requests.do(
+            (cache_key, generation), lambda: self._exists(path, cache_key)
+        )
+
+    def _exists(self, path: str, cache_key: Optional[tuple] = None) -> bool:
+        """
+        Check if the object exist in weaviate, see `exists`.
+
+        Parameters
+        ----------
+        path : str
+            The path of the object.
+        cache_key : Optional[tuple], optional
+            The read cache key to cache a found object with, if None it is not cached,
+            by default None.
+
+        Returns
+        -------
+        bool
+            True if object exists, False otherwise.
+
+        Raises
+        ------
+        requests.ConnectionError
+            If the network connection to weaviate fails.
+        weaviate.UnexpectedStatusCodeException
+            If weaviate reports a none OK status.
+        """
+
+        generation = self._get_read_generation(cache_key)
         try:
             response = self._connection.head(
                 path=path,
@@ -718,11 +1370,60 @@ class DataObject:
             raise RequestsConnectionError("Could not check if object exist.") from conn_err
 
         if response.status_code == 204:
+            if cache_key is not None:
+                self._cache_read(cache_key, True, generation)
             return True
         if response.status_code == 404:
             return False
         raise UnexpectedStatusCodeException("Object exists", response)
 
+    def exists_many(
+        self,
+        uuids: Sequence[Union[str, uuid_lib.UUID]],
+        class_name: Optional[str] = None,
+        concurrency: int = 32,
+        stream: bool = False,
+    ) -> Union[List[bool], Iterator[Tuple[Union[str, uuid_lib.UUID], bool]]]:
+        """
+        Check if multiple objects exist in weaviate, sending the requests concurrently.
+
+        Parameters
+        ----------
+        uuids : Sequence of str or uuid.UUID
+            The UUIDs of the objects that may or may not exist within Weaviate.
+        class_name : Optional[str], optional
+            The class name of the objects, see `exists`, by default None
+        concurrency : int, optional
+            The maximal number of requests sent at the same time. The connection pool keeps
+            up to 100 connections alive, so higher values only open short lived connections,
+            by default 32.
+        stream : bool, optional
+            If True, return an iterator of `(uuid, result)` tuples in the order the requests
+            complete, so that the results can be processed while other requests are still
+            running, by default False.
+
+        Returns
+        -------
+        List[bool] or Iterator[Tuple[str or uuid.UUID, bool]]
+            For each of the `uuids`, True if the object exists, False otherwise. If `stream` is
+            True, an iterator of the uuids and whether they exist instead.
+
+        Raises
+        ------
+        requests.ConnectionError
+            If the network connection to weaviate fails.
+        weaviate.UnexpectedStatusCodeException
+            If weaviate reports a none OK status.
+        TypeError
+            If parameter has the wrong type.
+        ValueError
+            If uuid is not properly formed.
+        """
+
+        return _map_concurrently(
+            lambda uuid: self.exists(uuid, class_name), uuids, concurrency, stream
+        )
+
     def validate(
         self,
         data_object: Union[dict, str],
@@ -807,7 +1508,15 @@ class DataObject:
             weaviate_obj["id"] = get_valid_uuid(uuid)
 
         if vector is not None:
-            weaviate_obj["vector"] = get_vector(vector)
+            weaviate_obj["vector"] = self._get_vector(vector)
+
+        validation_cache = self._validation_cache  # the cache might be disabled concurrently
+        cache_key = None
+        if validation_cache is not None:
+            # keyed on the serialized object itself, so different objects can never collide
+            cache_key = _json_serialize(weaviate_obj)
+            if validation_cache.get(cache_key, False):
+                return {"error": None, "valid": True}
 
         path = "/objects/validate"
         try:
@@ -820,11 +1529,13 @@ class DataObject:
         result: dict = {"error": None}
 
         if response.status_code == 200:
+            if validation_cache is not None:
+                validation_cache.put(cache_key, True)
             result["valid"] = True
             return result
         if response.status_code == 422:
             result["valid"] = False
-            result["error"] = response.json()["error"]
+            result["error"] = _decode_json(response)["error"]
             return result
         raise UnexpectedStatusCodeException("Validate object", response)
 
@@ -2,7 +2,7 @@
 Reference class definition.
 """
 import warnings
-from typing import Union, Optional
+from typing import Union, Optional, Sequence, List
 
 from requests.exceptions import ConnectionError as RequestsConnectionError
 
@@ -12,10 +12,15 @@ from weaviate.error_msgs import (
     REF_DEPRECATION_OLD_V14_FROM_CLS_NS_W,
     REF_DEPRECATION_OLD_V14_TO_CLS_NS_W,
 )
-from weaviate.exceptions import UnexpectedStatusCodeException
+from weaviate.exceptions import UnexpectedStatusCodeException, WeaviateBaseError
 from weaviate.util import (
     get_valid_uuid,
     _capitalize_first_letter,
+    _check_positive_num,
+    _decode_json,
+    _get_batch_error_messages,
+    _map_concurrently,
+    _BEACON_PREFIX,
 )
 
 
@@ -598,6 +603,179 @@ class Reference:
             return
         raise UnexpectedStatusCodeException("Add property reference to object", response)
 
+    def add_many(
+        self,
+        references: Sequence[dict],
+        batch_size: int = 100,
+        concurrency: int = 1,
+    ) -> None:
+        """
+        Allows to link multiple objects to objects uni-directionally, with requests to the batch
+        endpoint, each one with up to `batch_size` references, instead of one request per
+        reference.
+
+        Parameters
+        ----------
+        references : Sequence[dict]
+            The references to be added. Each reference is a dict with the keyword arguments of the
+            `add` method, i.e. 'from_uuid', 'from_property_name', 'to_uuid', 'from_class_name' and
+            optionally 'to_class_name'. The 'from_class_name' is required because the batch
+            endpoint identifies the referencing object by its class name.
+        batch_size : int, optional
+            The maximal number of references sent with each request, by default 100.
+        concurrency : int, optional
+            The maximal number of requests sent at the same time, by default 1.
+
+        Examples
+        --------
+        >>> client.data_object.reference.add_many(
+        ...     [
+        ...         {
+        ...             'from_uuid': 'e067f671-1202-42c6-848b-ff4d1eb804ab',
+        ...             'from_property_name': 'wroteBooks',
+        ...             'to_uuid': 'a9c1b714-4f8a-4b01-a930-38b046d69d2d',
+        ...             'from_class_name': 'Author',
+        ...             'to_class_name': 'Book', # ONLY with Weaviate >= 1.14.0
+        ...         },
+        ...         {
+        ...             'from_uuid': 'e067f671-1202-42c6-848b-ff4d1eb804ab',
+        ...             'from_property_name': 'wroteBooks',
+        ...             'to_uuid': '8429f68f-860a-49ea-a50b-1f8789515882',
+        ...             'from_class_name': 'Author',
+        ...             'to_class_name': 'Book', # ONLY with Weaviate >= 1.14.0
+        ...         },
+        ...     ]
+        ... )
+
+        Raises
+        ------
+        requests.ConnectionError
+            If the network connection to weaviate fails.
+        weaviate.UnexpectedStatusCodeException
+            If weaviate reports a none OK status. The other references may have been added.
+        weaviate.WeaviateBaseError
+            If adding some of the references failed, the error message lists the failed references
+            with their errors. The other references may have been added.
+        TypeError
+            If the parameters are of the wrong type.
+        ValueError
+            If the parameters are of the wrong value.
+        """
+
+        _check_positive_num(batch_size, "batch_size", int)
+        is_server_version_14 = self._connection.server_version >= "1.14"
+        batch_references = [
+            _get_batch_reference(is_server_version_14=is_server_version_14, **reference)
+            for reference in references
+        ]
+        batches = []
+        for start in range(0, len(batch_references), batch_size):
+            end = start + batch_size
+            batches.append(batch_references[start:end])
+        _map_concurrently(self._add_batch, batches, concurrency)
+
+    def _add_batch(self, batch_references: List[dict]) -> None:
+        """
+        Add references with a single request to the batch endpoint, see `add_many`.
+
+        Parameters
+        ----------
+        batch_references : List[dict]
+            The references, see `_get_batch_reference`.
+
+        Raises
+        ------
+        requests.ConnectionError
+            If the network connection to weaviate fails.
+        weaviate.UnexpectedStatusCodeException
+            If weaviate reports a none OK status.
+        weaviate.WeaviateBaseError
+            If adding some of the references failed.
+        """
+
+        try:
+            response = self._connection.post(
+                path="/batch/references",
+                weaviate_object=batch_references,
+            )
+        except RequestsConnectionError as conn_err:
+            raise RequestsConnectionError("References were not added.") from conn_err
+        if response.status_code != 200:
+            raise UnexpectedStatusCodeException("Add property references to objects", response)
+        results = _decode_json(response)
+        # the batch endpoint responds with 200 even if some of the references failed
+        failures = []
+        for result in results:
+            messages = _get_batch_error_messages(result)
+            if messages:
+                failures.append(
+                    f"{result.get('from')} -> {result.get('to')}: {', '.join(messages)}"
+                )
+        if failures:
+            raise WeaviateBaseError(
+                f"Adding {len(failures)} of {len(results)} references failed: "
+                + "; ".join(failures)
+            )
+
+
+def _get_batch_reference(
+    from_uuid: str,
+    from_property_name: str,
+    to_uuid: str,
+    from_class_name: str,
+    to_class_name: Optional[str] = None,
+    is_server_version_14: bool = True,
+) -> dict:
+    """
+    Get a reference in the format of the batch endpoint, see `Reference.add_many`.
+
+    Parameters
+    ----------
+    from_uuid : str
+        The ID of the object that should have the reference as part of its properties.
+    from_property_name : str
+        The name of the property within the object.
+    to_uuid : str
+        The UUID of the object that should be referenced.
+    from_class_name : str
+        The class name of the object that should have the reference.
+    to_class_name : Optional[str], optional
+        The class name of the object that should be referenced. Used with Weaviate >= 1.14.0,
+        by default None.
+    is_server_version_14 : bool, optional
+        Whether the Weaviate server version is >= 1.14.0, by default True.
+
+    Returns
+    -------
+    dict
+        The reference as a dict with the 'from' and 'to' beacons.
+
+    Raises
+    ------
+    TypeError
+        If the parameters are of the wrong type.
+    ValueError
+        If the parameters are of the wrong value.
+    """
+
+    _validate_string_arguments(argument=from_class_name, argument_name="from_class_name")
+    _validate_string_arguments(argument=from_property_name, argument_name="from_property_name")
+    from_uuid = get_valid_uuid(from_uuid)
+    to_uuid = get_valid_uuid(to_uuid)
+
+    if to_class_name is not None:
+        _validate_string_arguments(argument=to_class_name, argument_name="to_class_name")
+    if to_class_name and is_server_version_14:
+        to_beacon = f"{_BEACON_PREFIX}{_capitalize_first_letter(to_class_name)}/{to_uuid}"
+    else:
+        to_beacon = _BEACON_PREFIX + to_uuid
+
+    _class_name = _capitalize_first_letter(from_class_name)
+    return {
+        "from": f"{_BEACON_PREFIX}{_class_name}/{from_uuid}/{from_property_name}",
+        "to": to_beacon,
+    }
+
 
 def _get_beacon(to_uuid: str, class_name: Optional[str] = None) -> dict:
     """
@@ -618,8 +796,8 @@ def _get_beacon(to_uuid: str, class_name: Optional[str] = None) -> dict:
     """
 
     if class_name is None:
-        return {"beacon": f"weaviate://localhost/{to_uuid}"}
-    return {"beacon": f"weaviate://localhost/{class_name}/{to_uuid}"}
+        return {"beacon": _BEACON_PREFIX + to_uuid}
+    return {"beacon": f"{_BEACON_PREFIX}{class_name}/{to_uuid}"}
 
 
 def _validate_string_arguments(argument: str, argument_name: str) -> None:
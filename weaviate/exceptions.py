@@ -1,6 +1,8 @@
 """
 Weaviate Exceptions.
 """
+from typing import Any, Optional
+
 from requests import Response, exceptions
 
 ERROR_CODE_EXPLANATION = {
@@ -51,16 +53,15 @@ class UnexpectedStatusCodeException(WeaviateBaseError):
             The request response of which the status code was unexpected.
         """
         self._status_code: int = response.status_code
-        # Set error message
-
+        # decode the body only once, it is kept for the `json` attribute
         try:
-            body = response.json()
+            self._json = response.json()
         except exceptions.JSONDecodeError:
-            body = None
+            self._json = None
 
         msg = (
             message
-            + f"! Unexpected status code: {response.status_code}, with response body: {body}."
+            + f"! Unexpected status code: {response.status_code}, with response body: {self._json}."
         )
         if response.status_code in ERROR_CODE_EXPLANATION:
             msg += " " + ERROR_CODE_EXPLANATION[response.status_code]
@@ -71,6 +72,14 @@ class UnexpectedStatusCodeException(WeaviateBaseError):
     def status_code(self) -> int:
         return self._status_code
 
+    @property
+    def json(self) -> Optional[Any]:
+        """
+        The decoded JSON response body, None if the body is not valid JSON.
+        """
+
+        return self._json
+
 
 class ObjectAlreadyExistsException(WeaviateBaseError):
     """
@@ -13,7 +13,10 @@ from requests.exceptions import ConnectionError as RequestsConnectionError
 from weaviate.connect import Connection
 from weaviate.error_msgs import FILTER_BEACON_V14_CLS_NS_W
 from weaviate.exceptions import UnexpectedStatusCodeException
-from weaviate.util import get_vector
+from weaviate.util import get_vector, _decode_json, _SingleFlight
+
+# concurrent identical queries over the same connection share a single request, if enabled
+_query_requests = _SingleFlight()
 
 
 class GraphQL(ABC):
@@ -32,6 +35,23 @@ class GraphQL(ABC):
         """
 
         self._connection = connection
+        self._coalesce_requests = False
+
+    def with_request_coalescing(self) -> "GraphQL":
+        """
+        Share the request with the same query if it is already running over the same connection
+        (e.g. in another thread), i.e. wait for its response and reuse it instead of sending the
+        query again. The shared request may have started before `do` was called, so the response
+        may not reflect writes made right before `do` was called.
+
+        Returns
+        -------
+        weaviate.gql.filter.GraphQL
+            The updated query builder.
+        """
+
+        self._coalesce_requests = True
+        return self
 
     @abstractmethod
     def build(self) -> str:
@@ -47,7 +67,8 @@ class GraphQL(ABC):
 
     def do(self) -> dict:
         """
-        Builds and runs the query.
+        Builds and runs the query. See `with_request_coalescing` to share the request with the
+        same query already running over the same connection.
 
         Returns
         -------
@@ -64,12 +85,19 @@ class GraphQL(ABC):
 
         query = self.build()
 
+        def post() -> Any:
+            return self._connection.post(path="/graphql", weaviate_object={"query": query})
+
         try:
-            response = self._connection.post(path="/graphql", weaviate_object={"query": query})
+            if self._coalesce_requests:
+                response = _query_requests.do((self._connection, query), post)
+            else:
+                response = post()
         except RequestsConnectionError as conn_err:
             raise RequestsConnectionError("Query was not successful.") from conn_err
         if response.status_code == 200:
-            return response.json()  # success
+            # decoded for each caller, so that callers sharing the response do not share the result
+            return _decode_json(response)  # success
         raise UnexpectedStatusCodeException("Query was not successful", response)
 
 
@@ -7,6 +7,7 @@ from requests.exceptions import ConnectionError as RequestsConnectionError
 
 from weaviate.connect import Connection
 from weaviate.exceptions import UnexpectedStatusCodeException
+from weaviate.util import _decode_json
 from .aggregate import AggregateBuilder
 from .get import GetBuilder
 
@@ -148,5 +149,61 @@ class Query:
         except RequestsConnectionError as conn_err:
             raise RequestsConnectionError("Query not executed.") from conn_err
         if response.status_code == 200:
-            return response.json()  # Successfully queried
+            return _decode_json(response)  # Successfully queried
         raise UnexpectedStatusCodeException("GQL query failed", response)
+
+    def raw_many(self, gql_queries: List[str]) -> List[dict]:
+        """
+        Allows to send multiple simple graph QL string queries with a single request, instead of
+        one request per query. Be cautious of injection risks when generating query strings.
+
+        Parameters
+        ----------
+        gql_queries : List[str]
+            GraphQL queries as strings. The queries of the builders can be obtained with their
+            `build` method.
+
+        Returns
+        -------
+        List[dict]
+            Data responses of the queries, in the same order as `gql_queries`.
+
+        Examples
+        --------
+        >>> client.query.raw_many(
+        ...     [
+        ...         client.query.get('Article', ['title']).with_limit(2).build(),
+        ...         client.query.aggregate('Article').with_meta_count().build(),
+        ...     ]
+        ... )
+        [
+            {"data": {"Get": {"Article": [...]}}},
+            {"data": {"Aggregate": {"Article": [{"meta": {"count": 4403}}]}}}
+        ]
+
+        Raises
+        ------
+        TypeError
+            If 'gql_queries' is not a list of str.
+        requests.ConnectionError
+            If the network connection to weaviate fails.
+        weaviate.UnexpectedStatusCodeException
+            If weaviate reports a none OK status.
+        """
+
+        if not isinstance(gql_queries, list) or not all(
+            isinstance(gql_query, str) for gql_query in gql_queries
+        ):
+            raise TypeError("Queries are expected to be a list of strings")
+        if not gql_queries:
+            return []
+
+        json_queries = [{"query": gql_query} for gql_query in gql_queries]
+
+        try:
+            response = self._connection.post(path="/graphql/batch", weaviate_object=json_queries)
+        except RequestsConnectionError as conn_err:
+            raise RequestsConnectionError("Queries not executed.") from conn_err
+        if response.status_code == 200:
+            return _decode_json(response)  # Successfully queried
+        raise UnexpectedStatusCodeException("GQL queries failed", response)
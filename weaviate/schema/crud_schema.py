@@ -1,7 +1,7 @@
 """
 Schema class definition.
 """
-from typing import Union, Optional
+from typing import Union, Optional, Iterator, Tuple
 
 from requests.exceptions import ConnectionError as RequestsConnectionError
 
@@ -14,7 +14,14 @@ from weaviate.schema.validate_schema import (
     CLASS_KEYS,
     PROPERTY_KEYS,
 )
-from weaviate.util import _get_dict_from_object, _is_sub_schema, _capitalize_first_letter
+from weaviate.util import (
+    _get_dict_from_object,
+    _is_sub_schema,
+    _capitalize_first_letter,
+    _check_positive_num,
+    _decode_json,
+    _map_concurrently,
+)
 
 _PRIMITIVE_WEAVIATE_TYPES_SET = {
     "string",
@@ -58,14 +65,18 @@ class Schema:
         self._connection = connection
         self.property = Property(self._connection)
 
-    def create(self, schema: Union[dict, str]) -> None:
+    def create(self, schema: Union[dict, str], concurrency: int = 1) -> None:
         """
-        Create the schema at the weaviate instance.
+        Create the schema at the weaviate instance. All the classes are created first, with their
+        primitive properties, then their cross-reference properties are added.
 
         Parameters
         ----------
         schema : dict or str
             Schema as a python dict, or the path to a json file or a url of a json file.
+        concurrency : int, optional
+            The maximal number of classes that are created, or get their cross-reference
+            properties, at the same time, by default 1.
 
         Examples
         --------
@@ -109,8 +120,9 @@ class Schema:
         loaded_schema = _get_dict_from_object(schema)
         # validate the schema before loading
         validate_schema(loaded_schema)
-        self._create_classes_with_primitives(loaded_schema["classes"])
-        self._create_complex_properties_from_classes(loaded_schema["classes"])
+        _check_positive_num(concurrency, "concurrency", int)
+        self._create_classes_with_primitives(loaded_schema["classes"], concurrency)
+        self._create_complex_properties_from_classes(loaded_schema["classes"], concurrency)
 
     def create_class(self, schema_class: Union[dict, str]) -> None:
         """
@@ -200,19 +212,42 @@ class Schema:
         if response.status_code != 200:
             raise UnexpectedStatusCodeException("Delete class from schema", response)
 
-    def delete_all(self) -> None:
+    def delete_all(self, concurrency: int = 1) -> None:
         """
         Remove the entire schema from the Weaviate instance and all data associated with it.
+        The deletion of every class is attempted, even if the deletion of another class fails.
+
+        Parameters
+        ----------
+        concurrency : int, optional
+            The maximal number of classes deleted at the same time, by default 1.
 
         Examples
         --------
         >>> client.schema.delete_all()
+
+        Raises
+        ------
+        requests.ConnectionError
+            If the network connection to weaviate fails.
+        weaviate.UnexpectedStatusCodeException
+            If weaviate reports a none OK status. If deleting multiple classes failed, the error
+            of the first of them is raised, after all the other classes were deleted.
         """
 
         schema = self.get()
-        classes = schema.get("classes", [])
-        for _class in classes:
-            self.delete_class(_class["class"])
+        class_names = [_class["class"] for _class in schema.get("classes", [])]
+
+        def delete_class(class_name: str) -> Optional[Exception]:
+            try:
+                self.delete_class(class_name)
+            except (RequestsConnectionError, UnexpectedStatusCodeException) as error:
+                return error
+            return None
+
+        for error in _map_concurrently(delete_class, class_names, concurrency):
+            if error is not None:
+                raise error
 
     def contains(self, schema: Optional[Union[dict, str]] = None) -> bool:
         """
@@ -446,7 +481,7 @@ class Schema:
             raise RequestsConnectionError("Schema could not be retrieved.") from conn_err
         if response.status_code != 200:
             raise UnexpectedStatusCodeException("Get schema", response)
-        return response.json()
+        return _decode_json(response)
 
     def get_class_shards(self, class_name: str) -> list:
         """
@@ -491,14 +526,16 @@ class Schema:
             ) from conn_err
         if response.status_code != 200:
             raise UnexpectedStatusCodeException("Get shards' status", response)
-        return response.json()
+        return _decode_json(response)
 
     def update_class_shard(
         self,
         class_name: str,
         status: str,
         shard_name: Optional[str] = None,
-    ) -> list:
+        concurrency: int = 1,
+        stream: bool = False,
+    ) -> Union[list, dict, Iterator[Tuple[str, dict]]]:
         """
         Get the status of all shards in an index.
 
@@ -511,11 +548,19 @@ class Schema:
         shard_name : str or None, optional
             The shard name for which to update the status of the class of the shard. If None then
             all the shards are going to be updated to the 'status'. By default None.
+        concurrency : int, optional
+            The maximal number of shards updated at the same time if `shard_name` is None,
+            by default 1.
+        stream : bool, optional
+            If True, return an iterator of `(shard_name, status)` tuples in the order the updates
+            complete, so that the progress can be followed. The iteration stops at the first
+            failed update, without starting the remaining ones. By default False.
 
         Returns
         -------
-        list
-            The updated statuses.
+        list, dict or Iterator[Tuple[str, dict]]
+            The updated statuses, or the updated status if `shard_name` is given. If `stream` is
+            True, an iterator of the shard names and their updated statuses instead.
 
         Examples
         --------
@@ -569,32 +614,62 @@ class Schema:
             shard_names = [shard_name]
 
         data = {"status": status}
+        shards_path = f"/schema/{_capitalize_first_letter(class_name)}/shards/"
 
-        to_return = []
-
-        for _shard_name in shard_names:
-            path = f"/schema/{_capitalize_first_letter(class_name)}/shards/{_shard_name}"
-            try:
-                response = self._connection.put(
-                    path=path,
-                    weaviate_object=data,
-                )
-            except RequestsConnectionError as conn_err:
-                raise RequestsConnectionError(
-                    f"Class shards' status could not be updated for shard '{_shard_name}' due to "
-                    "connection error."
-                ) from conn_err
-            if response.status_code != 200:
-                raise UnexpectedStatusCodeException(
-                    f"Update shard '{_shard_name}' status",
-                    response,
-                )
-            to_return.append(response.json())
+        to_return = _map_concurrently(
+            lambda _shard_name: self._update_shard(shards_path, _shard_name, data),
+            shard_names,
+            concurrency,
+            stream,
+        )
 
-        if shard_name is None:
+        if shard_name is None or stream:
             return to_return
         return to_return[0]
 
+    def _update_shard(self, shards_path: str, shard_name: str, data: dict) -> dict:
+        """
+        Update the status of a shard, see `update_class_shard`.
+
+        Parameters
+        ----------
+        shards_path : str
+            The path of the shards of the class.
+        shard_name : str
+            The name of the shard.
+        data : dict
+            The new status of the shard.
+
+        Returns
+        -------
+        dict
+            The updated status.
+
+        Raises
+        ------
+        requests.ConnectionError
+            If the network connection to weaviate fails.
+        weaviate.UnexpectedStatusCodeException
+            If weaviate reports a none OK status.
+        """
+
+        try:
+            response = self._connection.put(
+                path=shards_path + shard_name,
+                weaviate_object=data,
+            )
+        except RequestsConnectionError as conn_err:
+            raise RequestsConnectionError(
+                f"Class shards' status could not be updated for shard '{shard_name}' due to "
+                "connection error."
+            ) from conn_err
+        if response.status_code != 200:
+            raise UnexpectedStatusCodeException(
+                f"Update shard '{shard_name}' status",
+                response,
+            )
+        return _decode_json(response)
+
     def _create_complex_properties_from_class(self, schema_class: dict) -> None:
         """
         Add cross-references to already existing class.
@@ -641,18 +716,25 @@ class Schema:
             if response.status_code != 200:
                 raise UnexpectedStatusCodeException("Add properties to classes", response)
 
-    def _create_complex_properties_from_classes(self, schema_classes_list: list) -> None:
+    def _create_complex_properties_from_classes(
+        self, schema_classes_list: list, concurrency: int = 1
+    ) -> None:
         """
-        Add cross-references to already existing classes.
+        Add cross-references to already existing classes. The properties of different classes
+        are added concurrently, the ones of the same class one after another.
 
         Parameters
         ----------
         schema_classes_list : list
             A list of classes as they are found in a schema json description.
+        concurrency : int, optional
+            The maximal number of classes that get their properties at the same time,
+            by default 1.
         """
 
-        for schema_class in schema_classes_list:
-            self._create_complex_properties_from_class(schema_class)
+        _map_concurrently(
+            self._create_complex_properties_from_class, schema_classes_list, concurrency
+        )
 
     def _create_class_with_primitives(self, weaviate_class: dict) -> None:
         """
@@ -692,7 +774,9 @@ class Schema:
         if response.status_code != 200:
             raise UnexpectedStatusCodeException("Create class", response)
 
-    def _create_classes_with_primitives(self, schema_classes_list: list) -> None:
+    def _create_classes_with_primitives(
+        self, schema_classes_list: list, concurrency: int = 1
+    ) -> None:
         """
         Create all the classes in the list and primitive properties.
         This function does not create references,
@@ -702,10 +786,11 @@ class Schema:
         ----------
         schema_classes_list : list
             A list of classes as they are found in a schema json description.
+        concurrency : int, optional
+            The maximal number of classes created at the same time, by default 1.
         """
 
-        for weaviate_class in schema_classes_list:
-            self._create_class_with_primitives(weaviate_class)
+        _map_concurrently(self._create_class_with_primitives, schema_classes_list, concurrency)
 
 
 def _property_is_primitive(data_type_list: list) -> bool:
@@ -724,9 +809,7 @@ def _property_is_primitive(data_type_list: list) -> bool:
         False otherwise.
     """
 
-    if len(set(data_type_list) - _PRIMITIVE_WEAVIATE_TYPES_SET) == 0:
-        return True
-    return False
+    return _PRIMITIVE_WEAVIATE_TYPES_SET.issuperset(data_type_list)
 
 
 def _get_primitive_properties(properties_list: list) -> list:
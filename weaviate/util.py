@@ -4,16 +4,49 @@ Helper functions!
 import base64
 import json
 import os
+import re
+import sys
+import time
 import uuid as uuid_lib
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from io import BufferedReader
 from numbers import Real
-from typing import Union, Sequence, Any, Optional
+from threading import Lock
+from typing import (
+    TYPE_CHECKING,
+    Union,
+    Sequence,
+    Any,
+    Optional,
+    Hashable,
+    Tuple,
+    Callable,
+    Dict,
+    List,
+    Iterator,
+)
 
 import requests
 import validators
 
 from weaviate.exceptions import SchemaValidationException
 
+if TYPE_CHECKING:
+    import numpy
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional dependency, fall back to the standard library
+    orjson = None
+
+# a UUID in the canonical form that `str(uuid.UUID(...))` returns
+_CANONICAL_UUID_RE = re.compile(r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}")
+
+# the prefix of the beacons that reference objects of the same weaviate instance
+_BEACON_PREFIX = "weaviate://localhost/"
+
 
 def image_encoder_b64(image_or_image_path: Union[str, BufferedReader]) -> str:
     """
@@ -111,8 +144,8 @@ def generate_local_beacon(
         raise TypeError("Expected to_object_uuid of type str or uuid.UUID")
 
     if class_name is None:
-        return {"beacon": f"weaviate://localhost/{uuid}"}
-    return {"beacon": f"weaviate://localhost/{class_name}/{uuid}"}
+        return {"beacon": _BEACON_PREFIX + uuid}
+    return {"beacon": f"{_BEACON_PREFIX}{class_name}/{uuid}"}
 
 
 def _get_dict_from_object(object_: Union[str, dict]) -> dict:
@@ -273,6 +306,35 @@ def get_valid_uuid(uuid: Union[str, uuid_lib.UUID]) -> str:
     if not isinstance(uuid, str):
         raise TypeError("'uuid' must be of type str or uuid.UUID, but was: " + str(type(uuid)))
 
+    return _get_valid_uuid_from_str(uuid)
+
+
+@lru_cache(maxsize=1024)
+def _get_valid_uuid_from_str(uuid: str) -> str:
+    """
+    Validate and extract the UUID from a string, see `get_valid_uuid`. The results are cached
+    because the same UUIDs are validated repeatedly, e.g. while polling a classification.
+
+    Parameters
+    ----------
+    uuid : str
+        The UUID to be validated and extracted.
+
+    Returns
+    -------
+    str
+        The extracted UUID.
+
+    Raises
+    ------
+    ValueError
+        If 'uuid' is not valid or cannot be extracted.
+    """
+
+    # fast path for the most common input, it needs neither URL parsing nor conversion
+    if _CANONICAL_UUID_RE.fullmatch(uuid) is not None:
+        return uuid
+
     _is_weaviate_url = is_weaviate_object_url(uuid)
     _is_object_url = is_object_url(uuid)
     _uuid = uuid
@@ -323,6 +385,217 @@ def get_vector(vector: Sequence) -> list:
             ) from None
 
 
+def _get_vector_payload(vector: Sequence) -> Union[list, "numpy.ndarray"]:
+    """
+    Get the embedding vector to put in a request payload, see `get_vector`. If `orjson` is
+    installed, array-like embeddings are kept as a (squeezed) `numpy.ndarray`, which `orjson`
+    serializes without creating a python float object for every element.
+
+    Parameters
+    ----------
+    vector: Sequence
+        The embedding of an object.
+
+    Returns
+    -------
+    list or numpy.ndarray
+        The embedding.
+
+    Raises
+    ------
+    TypeError
+        If 'vector' is not of a supported type.
+    """
+
+    if orjson is not None and not isinstance(vector, list):
+        array = _get_numpy_array(vector)
+        if array is not None:
+            return array
+    return get_vector(vector)
+
+
+def _round_vector(
+    vector: Union[list, "numpy.ndarray"], decimals: int
+) -> Union[list, "numpy.ndarray"]:
+    """
+    Round the elements of an embedding vector, so that its JSON representation is shorter.
+
+    Parameters
+    ----------
+    vector : list or numpy.ndarray
+        The embedding, as returned by `_get_vector_payload`.
+    decimals : int
+        The number of decimals to keep.
+
+    Returns
+    -------
+    list or numpy.ndarray
+        The rounded embedding, of the same type as `vector`.
+    """
+
+    if isinstance(vector, list):
+        return [round(element, decimals) for element in vector]
+    return vector.round(decimals)
+
+
+def _get_numpy_array(vector: Any) -> Optional["numpy.ndarray"]:
+    """
+    Get the embedding as a `numpy.ndarray` without copying it, if possible.
+
+    Parameters
+    ----------
+    vector: Any
+        The embedding of an object.
+
+    Returns
+    -------
+    numpy.ndarray or None
+        The squeezed embedding, or None if `vector` is not a `numpy.ndarray`, `torch.Tensor` or
+        `tf.Tensor`.
+    """
+
+    # look the libraries up instead of importing them, if they were never imported then `vector`
+    # cannot be one of their types
+    numpy_module = sys.modules.get("numpy")
+    if numpy_module is None:
+        return None
+    if isinstance(vector, numpy_module.ndarray):
+        return vector.squeeze()
+    torch = sys.modules.get("torch")
+    if torch is not None and isinstance(vector, torch.Tensor):
+        try:
+            # CPU tensors share their memory with the returned array
+            return vector.detach().cpu().numpy().squeeze()
+        except TypeError:
+            # dtypes without a numpy equivalent (e.g. bfloat16) are converted with `tolist`
+            return None
+    tensorflow = sys.modules.get("tensorflow")
+    if tensorflow is not None and isinstance(vector, tensorflow.Tensor):
+        return vector.numpy().squeeze()
+    return None
+
+
+def _json_default(obj: Any) -> Any:
+    """
+    Serialize objects that are not natively supported by the JSON encoder, e.g. non-contiguous
+    `numpy.ndarray`s or numpy scalars.
+
+    Parameters
+    ----------
+    obj : Any
+        The object to serialize.
+
+    Returns
+    -------
+    Any
+        A JSON serializable representation of `obj`.
+
+    Raises
+    ------
+    TypeError
+        If `obj` cannot be serialized.
+    """
+
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _json_serialize(obj: Any) -> Optional[bytes]:
+    """
+    Serialize a request payload to JSON. Uses `orjson` if it is installed, the standard library
+    `json` module otherwise. Payloads that `orjson` cannot encode like the standard library, i.e.
+    with non-str keys or with NaN or infinite numbers (which `orjson` writes as null), are
+    serialized with the standard library.
+
+    Parameters
+    ----------
+    obj : Any
+        The payload to serialize.
+
+    Returns
+    -------
+    bytes or None
+        The UTF-8 encoded JSON, or None if `obj` is None.
+
+    Raises
+    ------
+    TypeError
+        If `obj` cannot be serialized.
+    ValueError
+        If `obj` contains NaN or infinite numbers.
+    """
+
+    if obj is None:
+        return None
+    if orjson is not None:
+        try:
+            payload = orjson.dumps(obj, default=_json_default, option=orjson.OPT_SERIALIZE_NUMPY)
+        except orjson.JSONEncodeError:
+            pass
+        else:
+            # null is rare in payloads, so it is cheaper to look for it than for NaN
+            if b"null" not in payload:
+                return payload
+    return json.dumps(
+        obj,
+        default=_json_default,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        allow_nan=False,
+    ).encode("utf-8")
+
+
+def _decode_json(response: requests.Response) -> Any:
+    """
+    Decode the JSON body of a response. Uses `orjson` on the raw response bytes if it is
+    installed, `requests.Response.json` otherwise.
+
+    Parameters
+    ----------
+    response : requests.Response
+        The response to decode.
+
+    Returns
+    -------
+    Any
+        The decoded body.
+
+    Raises
+    ------
+    requests.exceptions.JSONDecodeError
+        If the body is not valid JSON.
+    """
+
+    if orjson is None:
+        return response.json()
+    try:
+        return orjson.loads(response.content)
+    except orjson.JSONDecodeError as error:
+        raise requests.exceptions.JSONDecodeError(error.msg, error.doc, error.pos) from None
+
+
+def _get_batch_error_messages(result: dict) -> List[str]:
+    """
+    Get the error messages of one result of a batch endpoint response.
+
+    Parameters
+    ----------
+    result : dict
+        The result of one object or reference of the batch endpoint response.
+
+    Returns
+    -------
+    List[str]
+        The error messages, empty if the object or reference was added successfully.
+    """
+
+    errors = result.get("result", {}).get("errors")
+    if errors is None:
+        return []
+    return [error.get("message", "") for error in errors.get("error", [])]
+
+
 def get_domain_from_weaviate_url(url: str) -> str:
     """
     Get the domain from a weaviate URL.
@@ -516,3 +789,259 @@ def _check_positive_num(value: Real, arg_name: str, data_type: type) -> None:
         raise TypeError(f"'{arg_name}' must be of type {data_type}.")
     if value <= 0:
         raise ValueError(f"'{arg_name}' must be positive, i.e. greater that zero (>0).")
+
+
+class _LRUCache:
+    """
+    Thread-safe cache that keeps at most `maxsize` entries, evicting the least recently used one
+    first. Entries can optionally expire `ttl` seconds after they were put.
+    """
+
+    def __init__(self, maxsize: int, ttl: Optional[Real] = None):
+        """
+        Initialize a _LRUCache class instance.
+
+        Parameters
+        ----------
+        maxsize : int
+            The maximum number of entries kept in the cache.
+        ttl : Real or None, optional
+            The number of seconds an entry is valid for, if None entries do not expire,
+            by default None.
+        """
+
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._entries: "OrderedDict[Hashable, Tuple[Any, Optional[float]]]" = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get a cached value.
+
+        Parameters
+        ----------
+        key : Hashable
+            The key of the value.
+        default : Any, optional
+            The value to return if the key is not cached or expired, by default None.
+
+        Returns
+        -------
+        Any
+            The cached value or `default`.
+        """
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            value, expires_at = entry
+            if expires_at is not None and time.monotonic() >= expires_at:
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Cache a value, evicting the least recently used value if the cache is full.
+
+        Parameters
+        ----------
+        key : Hashable
+            The key of the value.
+        value : Any
+            The value to cache.
+        """
+
+        expires_at = None if self._ttl is None else time.monotonic() + self._ttl
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """
+        Remove a value from the cache.
+
+        Parameters
+        ----------
+        key : Hashable or None, optional
+            The key of the value to remove, if None all values are removed, by default None.
+        """
+
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def invalidate_if(self, predicate: Callable[[Hashable], bool]) -> None:
+        """
+        Remove all values whose key matches a predicate.
+
+        Parameters
+        ----------
+        predicate : Callable[[Hashable], bool]
+            Called with every cached key, the value is removed if it returns True.
+        """
+
+        with self._lock:
+            for key in [key for key in self._entries if predicate(key)]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """
+        Remove all values from the cache.
+        """
+
+        self.invalidate()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class _SingleFlight:
+    """
+    Thread-safe deduplication of concurrent calls: while a call for a key is running, other calls
+    for the same key wait for it and get its result (or exception) instead of running again.
+    """
+
+    def __init__(self):
+        """
+        Initialize a _SingleFlight class instance.
+        """
+
+        self._calls: Dict[Hashable, Future] = {}
+        self._lock = Lock()
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        """
+        Call `func`, unless a call for the same key is running already, in which case wait for
+        that call instead. All the waiting callers share the same result object.
+
+        Parameters
+        ----------
+        key : Hashable
+            The key of the call.
+        func : Callable[[], Any]
+            The function to call.
+
+        Returns
+        -------
+        Any
+            The result of `func`.
+
+        Raises
+        ------
+        Exception
+            The exception raised by `func`.
+        """
+
+        with self._lock:
+            call = self._calls.get(key)
+            is_caller = call is None
+            if is_caller:
+                call = self._calls[key] = Future()
+
+        if not is_caller:
+            return call.result()
+
+        try:
+            result = func()
+        except BaseException as error:
+            call.set_exception(error)
+            raise
+        else:
+            call.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+
+def _map_concurrently(
+    func: Callable[[Any], Any],
+    items: Sequence,
+    concurrency: int,
+    stream: bool = False,
+) -> Union[list, Iterator[Tuple[Any, Any]]]:
+    """
+    Call a function for every item using a pool of threads.
+
+    Parameters
+    ----------
+    func : Callable[[Any], Any]
+        The function to call with each item.
+    items : Sequence
+        The items.
+    concurrency : int
+        The maximal number of concurrent calls.
+    stream : bool, optional
+        If True, return an iterator of `(item, result)` tuples in completion order instead,
+        by default False.
+
+    Returns
+    -------
+    list or Iterator[Tuple[Any, Any]]
+        The results in the same order as `items`, or an iterator of `(item, result)` tuples in
+        completion order if `stream` is True.
+
+    Raises
+    ------
+    TypeError
+        If 'concurrency' is not of type int.
+    ValueError
+        If 'concurrency' is not positive.
+    Exception
+        The first exception raised by `func`, in the order of `items` (in completion order if
+        `stream` is True). If 'concurrency' is 1 and `stream` is False, the items after it are
+        not processed.
+    """
+
+    _check_positive_num(concurrency, "concurrency", int)
+    if stream:
+        return _iterate_concurrently(func, items, concurrency)
+    if concurrency == 1 or len(items) <= 1:
+        return [func(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(items))) as executor:
+        return list(executor.map(func, items))
+
+
+def _iterate_concurrently(
+    func: Callable[[Any], Any], items: Sequence, concurrency: int
+) -> Iterator[Tuple[Any, Any]]:
+    """
+    Call a function for every item using a pool of threads, see `_map_concurrently`.
+
+    Parameters
+    ----------
+    func : Callable[[Any], Any]
+        The function to call with each item.
+    items : Sequence
+        The items.
+    concurrency : int
+        The maximal number of concurrent calls.
+
+    Returns
+    -------
+    Iterator[Tuple[Any, Any]]
+        The `(item, result)` tuples in completion order.
+    """
+
+    if len(items) == 0:
+        return
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(items))) as executor:
+        futures = {executor.submit(func, item): item for item in items}
+        try:
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+        finally:
+            # do not start the remaining calls if the iteration stopped early or failed
+            for future in futures:
+                future.cancel()